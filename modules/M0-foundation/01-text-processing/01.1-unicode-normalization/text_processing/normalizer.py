@@ -10,6 +10,7 @@ Memory Target: <100MB for 10K documents
 
 import re
 import unicodedata
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import List, Optional
 
@@ -64,10 +65,48 @@ REMOVE_CHARS = {
 }
 
 
+def _name_prefix(char: str) -> Optional[str]:
+    """First word of a letter/digit's Unicode name ('LATIN', 'CJK', ...), else None."""
+    if not char.isalnum():
+        return None
+    name = unicodedata.name(char, '')
+    return name.split(' ', 1)[0] if name else None
+
+
+def _build_bmp_script_table():
+    """
+    Precompute the name prefix of every BMP code point.
+    
+    Returns:
+        Tuple of (table, prefixes): table is a 64K str for str.translate
+        mapping each code point to chr(i), where prefixes[i] is its name
+        prefix; i == 0 marks characters that are not counted.
+    """
+    prefixes = [None]
+    prefix_ids = {}
+    table = bytearray(0x10000)
+    for cp in range(0x10000):
+        prefix = _name_prefix(chr(cp))
+        if prefix is not None:
+            if prefix not in prefix_ids:
+                prefix_ids[prefix] = len(prefixes)
+                prefixes.append(prefix)
+            table[cp] = prefix_ids[prefix]
+    # Fewer than 256 distinct prefixes in the BMP, so one byte per entry
+    return table.decode('latin-1'), tuple(prefixes)
+
+
+_BMP_SCRIPT_TABLE, _BMP_SCRIPT_PREFIXES = _build_bmp_script_table()
+
+
 def detect_script(text: str) -> str:
     """
     Detect primary script of text using Unicode script property.
     
+    BMP characters are classified with one str.translate pass over a
+    precomputed table and counted with Counter; only supplementary-plane
+    characters (left unchanged by the table) fall back to unicodedata.
+    
     Args:
         text: Input text
         
@@ -77,16 +116,15 @@ def detect_script(text: str) -> str:
     if not text:
         return "Zyyy"
     
-    # Count characters per script
+    # Count characters per script, in order of first appearance
     script_counts = {}
-    for char in text:
-        if char.isspace() or not char.isalnum():
-            continue
-        try:
-            script = unicodedata.name(char).split()[0]
-            script_counts[script] = script_counts.get(script, 0) + 1
-        except ValueError:
+    for key, count in Counter(text.translate(_BMP_SCRIPT_TABLE)).items():
+        if key == '\0':
             continue
+        code = ord(key)
+        script = _BMP_SCRIPT_PREFIXES[code] if code < 0x10000 else _name_prefix(key)
+        if script is not None:
+            script_counts[script] = script_counts.get(script, 0) + count
     
     if not script_counts:
         return "Zyyy"
@@ -17,6 +17,8 @@ import sys
 from pathlib import Path
 from typing import List, Dict
 
+import numpy as np
+
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -26,6 +28,27 @@ from shared.logger import setup_logger
 logger = setup_logger(__name__)
 
 
+def latency_percentiles(values, percents=(50, 95, 99)) -> Dict[int, float]:
+    """
+    Compute a handful of percentiles with a single O(N) partition.
+    
+    np.percentile sorts the whole array; for a few nearest-rank quantiles
+    np.partition (quickselect) is enough and touches the data once.
+    
+    Args:
+        values: Sequence or array of samples
+        percents: Percentiles to compute (0-100)
+        
+    Returns:
+        Dictionary mapping percentile to value
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    last = arr.size - 1
+    ks = [min(last, arr.size * p // 100) for p in percents]
+    part = np.partition(arr, ks)
+    return {p: float(part[k]) for p, k in zip(percents, ks)}
+
+
 class LanguageDetectionBenchmark:
     """Benchmark suite for language detection."""
     
@@ -100,27 +123,27 @@ class LanguageDetectionBenchmark:
                     print(f"   ⚠️  {lang_code}: detected as {result.language_code}")
             
             all_latencies.extend(latencies)
-            results_by_lang[lang_code] = {
-                'mean': statistics.mean(latencies),
-                'median': statistics.median(latencies),
-                'p95': statistics.quantiles(latencies, n=20)[18],  # 95th percentile
-                'p99': statistics.quantiles(latencies, n=100)[98],  # 99th percentile
-                'min': min(latencies),
-                'max': max(latencies),
-            }
+            results_by_lang[lang_code] = self._summarize(latencies)
         
-        overall = {
-            'mean': statistics.mean(all_latencies),
-            'median': statistics.median(all_latencies),
-            'p95': statistics.quantiles(all_latencies, n=20)[18],
-            'p99': statistics.quantiles(all_latencies, n=100)[98],
-            'min': min(all_latencies),
-            'max': max(all_latencies),
-            'by_language': results_by_lang
-        }
+        overall = self._summarize(all_latencies)
+        overall['by_language'] = results_by_lang
         
         return overall
     
+    @staticmethod
+    def _summarize(latencies: List[float]) -> Dict:
+        """Summarize latency samples (mean, median, p95, p99, min, max)."""
+        arr = np.asarray(latencies, dtype=np.float64)
+        pct = latency_percentiles(arr)
+        return {
+            'mean': float(arr.mean()),
+            'median': pct[50],
+            'p95': pct[95],
+            'p99': pct[99],
+            'min': float(arr.min()),
+            'max': float(arr.max()),
+        }
+    
     def benchmark_batch_detection(self, batch_size: int = 100, num_batches: int = 50) -> Dict:
         """
         Benchmark batch detection.
@@ -160,7 +183,7 @@ class LanguageDetectionBenchmark:
         return {
             'batch_size': batch_size,
             'latency_mean_ms': statistics.mean(latencies),
-            'latency_p95_ms': statistics.quantiles(latencies, n=20)[18],
+            'latency_p95_ms': latency_percentiles(latencies, (95,))[95],
             'throughput_mean': statistics.mean(throughputs),
             'throughput_min': min(throughputs),
             'throughput_max': max(throughputs),
@@ -177,26 +200,26 @@ class LanguageDetectionBenchmark:
         
         correct = 0
         total = len(self.test_texts)
-        confidences = []
+        results = []
         
         for expected_lang, text in self.test_texts.items():
             result = self.detector.detect(text)
+            results.append(result)
             
             if result.language_code == expected_lang:
                 correct += 1
             else:
                 print(f"   ❌ {expected_lang}: detected as {result.language_code} (conf: {result.confidence:.3f})")
-            
-            confidences.append(result.confidence)
         
+        confidences = np.fromiter((r.confidence for r in results), dtype=np.float32, count=total)
         accuracy = correct / total
         
         return {
             'accuracy': accuracy,
             'correct': correct,
             'total': total,
-            'mean_confidence': statistics.mean(confidences),
-            'min_confidence': min(confidences),
+            'mean_confidence': float(confidences.mean()),
+            'min_confidence': float(confidences.min()),
         }
     
     def print_results(self, single_results: Dict, batch_results: Dict, accuracy_results: Dict):
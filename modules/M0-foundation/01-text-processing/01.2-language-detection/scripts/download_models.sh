@@ -20,27 +20,31 @@ cd "$MODELS_DIR"
 echo "📥 Downloading FastText language identification models..."
 echo ""
 
-# Option 1: Compressed model (917KB) - Fast, good accuracy
-echo "1️⃣  Downloading lid.176.bin (917KB, compressed)..."
-if [ -f "lid.176.bin" ]; then
-    echo "   ⚠️  lid.176.bin already exists, skipping..."
-else
-    wget -q --show-progress \
-        https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.bin \
-        -O lid.176.bin
-    echo "   ✅ lid.176.bin downloaded (917KB)"
-fi
-echo ""
-
-# Option 2: Full model (126MB) - Best accuracy (recommended)
-echo "2️⃣  Downloading lid.176.ftz (126MB, full accuracy)..."
+# Quantized model (917KB) - default, loaded first by the detector
+echo "1️⃣  Downloading lid.176.ftz (917KB, quantized)..."
 if [ -f "lid.176.ftz" ]; then
     echo "   ⚠️  lid.176.ftz already exists, skipping..."
 else
     wget -q --show-progress \
         https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.ftz \
         -O lid.176.ftz
-    echo "   ✅ lid.176.ftz downloaded (126MB)"
+    echo "   ✅ lid.176.ftz downloaded (917KB)"
+fi
+echo ""
+
+# Full-precision model (126MB) - only with --full (model_variant='bin')
+if [ "$1" = "--full" ]; then
+    echo "2️⃣  Downloading lid.176.bin (126MB, full precision)..."
+    if [ -f "lid.176.bin" ]; then
+        echo "   ⚠️  lid.176.bin already exists, skipping..."
+    else
+        wget -q --show-progress \
+            https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.bin \
+            -O lid.176.bin
+        echo "   ✅ lid.176.bin downloaded (126MB)"
+    fi
+else
+    echo "2️⃣  Skipping lid.176.bin (126MB); run with --full to download it"
 fi
 echo ""
 
@@ -58,8 +62,8 @@ echo "Available models:"
 ls -lh *.bin *.ftz 2>/dev/null | awk '{print "  -", $9, "("$5")"}'
 echo ""
 echo "📖 Usage:"
-echo "  - lid.176.bin: Fast, good for production (917KB)"
-echo "  - lid.176.ftz: Best accuracy, recommended (126MB) ✨"
+echo "  - lid.176.ftz: Quantized, default (917KB) ✨"
+echo "  - lid.176.bin: Full precision, model_variant='bin' (126MB)"
 echo "  - custom/*: Your trained models (up to 250+ languages)"
 echo ""
 echo "🚀 Ready to detect 176 languages!"
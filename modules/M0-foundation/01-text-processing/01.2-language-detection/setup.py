@@ -21,8 +21,9 @@ setup(
     packages=find_packages(exclude=["tests", "benchmarks", "scripts"]),
     python_requires=">=3.9",
     install_requires=[
-        "fasttext-wheel>=0.9.2",
-        "langdetect>=1.0.9",
+        # Inference only. Training needs fasttext-wheel in its place; both
+        # install the same fasttext/ package, so never install them together
+        "fasttext-predict>=0.9.2.2",
         "structlog>=23.2.0",
         "pydantic>=2.5.0",
     ],
@@ -38,6 +39,10 @@ setup(
             "isort>=5.13.2",
             "memory-profiler>=0.61.0",
         ],
+        "fallback": [
+            # N-gram fallback for very short texts (pure Python, slow to import)
+            "langdetect>=1.0.9",
+        ],
         "extended": [
             # Optional extended language detection
             # "polyglot>=16.7.4",  # Requires ICU installation
@@ -32,14 +32,19 @@ def setup_logger(
         level=log_level,
     )
     
-    # Configure structlog
+    # Configure structlog. Records below log_level never reach these
+    # processors: the filtering bound logger turns those methods into no-ops.
     processors = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
-        structlog.processors.StackInfoRenderer(),
-        structlog.dev.set_exc_info,
-        structlog.processors.TimeStamper(fmt="iso"),
     ]
+    if log_level <= logging.DEBUG:
+        # stack_info / implicit exc_info support, only worth it when debugging
+        processors += [
+            structlog.processors.StackInfoRenderer(),
+            structlog.dev.set_exc_info,
+        ]
+    processors.append(structlog.processors.TimeStamper(fmt="iso"))
     
     if json_format:
         processors.append(structlog.processors.JSONRenderer())
@@ -4,12 +4,13 @@ Pytest configuration and fixtures for language detection tests.
 
 import pytest
 from pathlib import Path
+from types import MappingProxyType
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_texts():
-    """Sample texts in various languages for testing."""
-    return {
+    """Sample texts in various languages for testing (read-only)."""
+    return MappingProxyType({
         # Latin scripts
         'en': "The quick brown fox jumps over the lazy dog",
         'es': "El rápido zorro marrón salta sobre el perro perezoso",
@@ -39,13 +40,13 @@ def test_texts():
         'el': "Η γρήγορη καφέ αλεπού πηδάει πάνω από το τεμπέλικο σκυλί",
         'th': "สุนัขจิ้งจอกสีน้ำตาลที่รวดเร็วกระโดดข้ามสุนัขที่ขี้เกียจ",
         'vi': "Con cáo nâu nhanh nhẹn nhảy qua con chó lười biếng",
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def short_texts():
     """Very short texts for testing fallback detection."""
-    return {
+    return MappingProxyType({
         'en': "Hello",
         'fa': "سلام",
         'ar': "مرحبا",
@@ -56,24 +57,24 @@ def short_texts():
         'es': "Hola",
         'fr': "Bonjour",
         'de': "Hallo",
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mixed_texts():
     """Mixed-language texts for testing."""
-    return [
+    return (
         "Hello سلام مرحبا",  # English + Persian + Arabic
         "This is English with 中文",  # English + Chinese
         "Bonjour, 안녕하세요",  # French + Korean
         "مرحبا Hello Привет",  # Arabic + English + Russian
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def edge_cases():
     """Edge case texts for robustness testing."""
-    return {
+    return MappingProxyType({
         'empty': "",
         'whitespace': "   \n\t  ",
         'numbers': "123456789",
@@ -82,16 +83,16 @@ def edge_cases():
         'single_char': "a",
         'emoji': "😀🎉🚀",
         'mixed_emoji': "Hello 😀 World",
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def models_dir():
     """Get models directory path."""
     return Path(__file__).parent.parent / "models"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def has_model(models_dir):
     """Check if any model is available."""
     if not models_dir.exists():
@@ -100,3 +101,40 @@ def has_model(models_dir):
     model_files = list(models_dir.glob("*.bin")) + list(models_dir.glob("*.ftz"))
     return len(model_files) > 0
 
+
+@pytest.fixture(scope="session")
+def detector(has_model):
+    """Shared UniversalLanguageDetector so the model loads once per session."""
+    if not has_model:
+        pytest.skip("No model available")
+    
+    from text_processing import UniversalLanguageDetector
+    return UniversalLanguageDetector()
+
+
+@pytest.fixture(scope="session")
+def make_detector(has_model):
+    """Factory for detectors with non-default settings, cached per kwargs."""
+    if not has_model:
+        pytest.skip("No model available")
+    
+    from text_processing import UniversalLanguageDetector
+    detectors = {}
+    
+    def _make(**kwargs):
+        key = tuple(sorted(kwargs.items()))
+        if key not in detectors:
+            detectors[key] = UniversalLanguageDetector(**kwargs)
+        return detectors[key]
+    
+    return _make
+
+
+@pytest.fixture(scope="session")
+def fasttext_detector(has_model):
+    """Shared FastTextDetector for backend-level tests."""
+    if not has_model:
+        pytest.skip("No model available")
+    
+    from text_processing.fasttext_detector import FastTextDetector
+    return FastTextDetector()
@@ -5,26 +5,156 @@ Wrapper for FastText language identification models.
 Supports both pre-trained (176 languages) and custom models (250+ languages).
 
 Model Options:
-- lid.176.bin: 917KB compressed model
-- lid.176.ftz: 126MB full accuracy model (recommended)
+- lid.176.ftz: 917KB quantized model (used first if present)
+- lid.176.bin: 126MB full-precision model (slightly more accurate)
 - Custom: Your trained model for 250+ languages
 """
 
+import importlib.util
+import logging
+import os
 import re
+import struct
+import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import TYPE_CHECKING, List, Literal, Tuple, Optional
 
 try:
-    import fasttext
-    FASTTEXT_AVAILABLE = True
+    import numpy as np
+    NUMPY_AVAILABLE = True
 except ImportError:
-    FASTTEXT_AVAILABLE = False
+    NUMPY_AVAILABLE = False
+
+# Both fasttext-predict (inference only, <1MB) and fasttext-wheel (full
+# library with training) install the ``fasttext`` module. It is imported
+# lazily in _load_model so importing this module doesn't pay for it.
+FASTTEXT_AVAILABLE = importlib.util.find_spec("fasttext") is not None
+
+if TYPE_CHECKING:
+    import fasttext
 
 from shared.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+def _clean(text: str) -> str:
+    """
+    Collapse whitespace runs (incl. newlines and NBSP) to single spaces.
+    
+    str.split() uses the same Unicode whitespace set as the regex \\s, so
+    this matches re.sub(r'\\s+', ' ', text.strip()) in one C-level pass.
+    """
+    return ' '.join(text.split()) if text else ''
+
+
+# Any Unicode letter; text without one (digits, symbols, punctuation) has
+# nothing for the model to identify
+_LETTER_RE = re.compile(r'[^\W\d_]')
+
+# Cleaned texts up to this length have their predictions memoized; longer
+# ones (whole documents) are rarely repeated and would only bloat the cache
+PREDICT_CACHE_MAX_LENGTH = 4096
+
+
+def _import_trainer():
+    """
+    Import the full fastText library for training.
+    
+    fasttext-predict ships only inference code, so training needs
+    fasttext-wheel installed in its place (both provide the ``fasttext``
+    package and must not be installed together).
+    
+    Returns:
+        The ``fasttext`` module
+        
+    Raises:
+        ImportError: If only the predict-only build is installed
+    """
+    try:
+        import fasttext
+    except ImportError:
+        fasttext = None
+    
+    if fasttext is None or not hasattr(fasttext, 'train_supervised'):
+        raise ImportError(
+            "Training requires the full fastText library. "
+            "Replace fasttext-predict with it: "
+            "pip uninstall -y fasttext-predict && pip install fasttext-wheel"
+        )
+    return fasttext
+
+
+def _prefetch_file(path: Path) -> None:
+    """
+    Hint the kernel to read a file sequentially and ahead of use.
+    
+    fastText's load_model only takes a path, so the file can't be mmap'ed
+    into it; read-ahead still turns the cold-start load into large
+    sequential reads.
+    
+    Args:
+        path: File to prefetch
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        # Advice values are not flags; each needs its own call
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError as e:
+        logger.debug("posix_fadvise failed", path=str(path), error=str(e))
+    finally:
+        os.close(fd)
+
+
+def _read_model_labels(model_path: Path) -> List[str]:
+    """
+    Read label names from a FastText .bin/.ftz file header.
+    
+    Layout: magic + version (2 x int32), args (12 x int32 + float64), then
+    the dictionary: size, nwords, nlabels (int32), ntokens, pruneidx_size
+    (int64) and `size` entries of NUL-terminated word, int64 count, int8 type.
+    
+    Args:
+        model_path: Path to model file
+        
+    Returns:
+        List of label strings in model order
+    """
+    with open(model_path, 'rb') as f:
+        f.seek(8 + 12 * 4 + 8)
+        size, _nwords, _nlabels = struct.unpack('<iii', f.read(12))
+        f.read(16)
+        
+        labels = []
+        buf = b''
+        pos = 0
+        for _ in range(size):
+            end = buf.find(b'\0', pos)
+            while end < 0 or end + 10 > len(buf):
+                chunk = f.read(1 << 20)
+                if not chunk:
+                    raise ValueError(f"Truncated FastText model: {model_path}")
+                buf = buf[pos:] + chunk
+                pos = 0
+                end = buf.find(b'\0')
+            entry_type = buf[end + 9]
+            if entry_type == 1:
+                labels.append(buf[pos:end].decode('utf-8'))
+            pos = end + 10
+    
+    return labels
+
+
 class FastTextDetector:
     """
     FastText-based language detection.
@@ -42,38 +172,93 @@ class FastTextDetector:
         [('en', 0.98), ('fr', 0.01), ...]
     """
     
-    # Default model paths
+    # Default model paths (model_variant='ftz')
     DEFAULT_MODELS = [
-        "models/lid.176.ftz",      # 126MB, best accuracy
-        "models/lid.176.bin",      # 917KB, compressed
+        "models/lid.176.ftz",      # 917KB, quantized
+        "models/lid.176.bin",      # 126MB, full precision
         "models/custom/model.bin",  # Custom trained model
     ]
     
-    def __init__(self, model_path: Optional[Path] = None):
+    # Search order for model_variant='bin'
+    FULL_PRECISION_MODELS = [
+        "models/lid.176.bin",
+        "models/lid.176.ftz",
+        "models/custom/model.bin",
+    ]
+    
+    # Quantized models only, searched when low_memory=True
+    LOW_MEMORY_MODELS = [
+        "models/lid.176.ftz",
+        "models/custom/model.ftz",
+    ]
+    
+    # Smallest batch worth sharding across threads in detect_batch
+    PARALLEL_MIN_BATCH = 64
+    
+    def __init__(
+        self,
+        model_path: Optional[Path] = None,
+        cache_size: int = 16384,
+        low_memory: bool = False,
+        prefetch: bool = False,
+        model_variant: Literal['ftz', 'bin'] = 'ftz'
+    ):
         """
         Initialize FastText detector.
         
         Args:
             model_path: Path to FastText model file
                        If None, searches for default models
+            cache_size: Max (text, k) results kept in the per-detector LRU
+                       cache (0 disables caching)
+            low_memory: Only search quantized (.ftz) default models, never
+                       falling back to the 126MB lid.176.bin. Costs roughly
+                       1-2% accuracy for a ~100x smaller resident model.
+            prefetch: Ask the kernel to read the model file ahead before
+                     loading (posix_fadvise; no-op where unsupported)
+            model_variant: Default model to prefer when model_path is None:
+                          'ftz' (quantized, default) or 'bin' (full precision)
         
         Raises:
             ImportError: If fasttext library not installed
             FileNotFoundError: If no model file found
+            ValueError: If model_variant is not 'ftz' or 'bin'
         """
         if not FASTTEXT_AVAILABLE:
             raise ImportError(
                 "fasttext library not installed. "
-                "Install with: pip install fasttext-wheel"
+                "Install with: pip install fasttext-predict"
             )
         
+        if model_variant not in ('ftz', 'bin'):
+            raise ValueError(f"model_variant must be 'ftz' or 'bin', got {model_variant!r}")
+        
+        self.low_memory = low_memory
+        self.model_variant = model_variant
         self.model_path = self._find_model(model_path)
+        if prefetch:
+            _prefetch_file(self.model_path)
         self.model = self._load_model()
+        self._labels = self._load_labels()
+        # '__label__en' -> 'en', parsed and interned once per model
+        self._label_map = {
+            label: sys.intern(label.replace('__label__', ''))
+            for label in self._labels
+        }
+        self._languages = list(self._label_map.values())
+        self._label_to_id = {label: i for i, label in enumerate(self._labels)}
+        # Per-instance cache so results never leak between models; a weak
+        # proxy keeps the cache from tying the detector in a reference cycle
+        self._predict_cached = lru_cache(maxsize=cache_size)(
+            partial(type(self)._predict, weakref.proxy(self))
+        )
+        # Skip building debug-only arguments (text slices) when DEBUG is off
+        self._debug = logger.is_enabled_for(logging.DEBUG)
         
         logger.info(
             "FastText detector initialized",
             model_path=str(self.model_path),
-            model_size_mb=self.model_path.stat().st_size / (1024 * 1024)
+            model_size_mb=self._model_size_mb
         )
     
     def _find_model(self, model_path: Optional[Path]) -> Path:
@@ -84,22 +269,28 @@ class FastTextDetector:
             model_path: User-provided model path (optional)
             
         Returns:
-            Path to model file
+            Path to model file (its size is kept in self._model_size_mb)
             
         Raises:
             FileNotFoundError: If no model found
         """
         if model_path:
             path = Path(model_path)
-            if path.exists():
+            if self._stat_model(path):
                 return path
             raise FileNotFoundError(f"Model not found: {model_path}")
         
         # Search for default models
         base_dir = Path(__file__).parent.parent
-        for model_rel_path in self.DEFAULT_MODELS:
+        if self.low_memory:
+            candidates = self.LOW_MEMORY_MODELS
+        elif self.model_variant == 'bin':
+            candidates = self.FULL_PRECISION_MODELS
+        else:
+            candidates = self.DEFAULT_MODELS
+        for model_rel_path in candidates:
             model_full_path = base_dir / model_rel_path
-            if model_full_path.exists():
+            if self._stat_model(model_full_path):
                 logger.info("Found model", path=str(model_full_path))
                 return model_full_path
         
@@ -110,6 +301,20 @@ class FastTextDetector:
             "Or specify model_path explicitly."
         )
     
+    def _stat_model(self, path: Path) -> bool:
+        """
+        Check a candidate model file exists, recording its size.
+        
+        A single os.stat both tests existence and yields the size logged
+        at init, instead of exists() followed by stat().
+        """
+        try:
+            size_bytes = os.stat(str(path)).st_size
+        except OSError:
+            return False
+        self._model_size_mb = size_bytes / (1024 * 1024)
+        return True
+    
     def _load_model(self) -> 'fasttext.FastText._FastText':
         """
         Load FastText model from disk.
@@ -119,20 +324,39 @@ class FastTextDetector:
         """
         logger.info("Loading FastText model", path=str(self.model_path))
         
+        import fasttext
+        
         # Suppress FastText warnings
         import warnings
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             model = fasttext.load_model(str(self.model_path))
         
+        # fasttext-predict's list predict returns labels without
+        # probabilities, so only the full build gets native batching
+        self._native_batch = hasattr(fasttext, 'train_supervised')
+        
         logger.info(
             "FastText model loaded",
-            num_labels=len(model.get_labels()),
-            model_dimension=model.get_dimension()
+            native_batch=self._native_batch
         )
         
         return model
     
+    def _load_labels(self) -> List[str]:
+        """
+        Get model labels ('__label__en', ...).
+        
+        fasttext-predict has no get_labels(), so labels are read from the
+        dictionary section of the model file instead.
+        
+        Returns:
+            List of label strings in model order
+        """
+        if hasattr(self.model, 'get_labels'):
+            return list(self.model.get_labels())
+        return _read_model_labels(self.model_path)
+    
     def detect(self, text: str, k: int = 3) -> List[Tuple[str, float]]:
         """
         Detect language of text using FastText.
@@ -143,37 +367,33 @@ class FastTextDetector:
             
         Returns:
             List of (language_code, probability) tuples
-            Sorted by probability descending
+            Sorted by probability descending; empty if text has no letters
+            
+        Raises:
+            ValueError: If text is None
             
         Example:
             >>> detector.detect("Hello world", k=2)
             [('en', 0.99), ('fr', 0.005)]
         """
-        if not text or not text.strip():
-            return []
+        if text is None:
+            raise ValueError("Input text cannot be None")
         
         # Preprocess text for FastText
         # Remove newlines and excessive whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = _clean(text)
+        if not text or not _LETTER_RE.search(text):
+            return []
         
         try:
-            # FastText predict returns:
-            # labels: tuple of strings like ('__label__en',)
-            # probabilities: tuple of floats
-            labels, probabilities = self.model.predict(text, k=k)
+            results = list(self._predict_or_cached(text, k))
             
-            # Parse results
-            results = []
-            for label, prob in zip(labels, probabilities):
-                # Extract language code from '__label__en' format
-                lang_code = label.replace('__label__', '')
-                results.append((lang_code, float(prob)))
-            
-            logger.debug(
-                "FastText detection",
-                text_preview=text[:50],
-                top_prediction=results[0] if results else None
-            )
+            if self._debug:
+                logger.debug(
+                    "FastText detection",
+                    text_preview=text[:50],
+                    top_prediction=results[0] if results else None
+                )
             
             return results
             
@@ -185,28 +405,246 @@ class FastTextDetector:
             )
             return []
     
-    def detect_batch(self, texts: List[str], k: int = 3) -> List[List[Tuple[str, float]]]:
+    def detect_top1(self, text: str) -> Optional[Tuple[str, float]]:
+        """
+        Detect the single most likely language (predict with k=1).
+        
+        Cheaper than detect() when alternates aren't needed: FastText only
+        tracks the best label instead of sorting the top k.
+        
+        Args:
+            text: Input text (any language)
+            
+        Returns:
+            (language_code, probability), or None if text has no letters
+            
+        Raises:
+            ValueError: If text is None
+        """
+        if text is None:
+            raise ValueError("Input text cannot be None")
+        
+        text = _clean(text)
+        if not text or not _LETTER_RE.search(text):
+            return None
+        
+        try:
+            results = self._predict_or_cached(text, 1)
+        except Exception as e:
+            logger.error(
+                "FastText detection failed",
+                error=str(e),
+                text_preview=text[:100]
+            )
+            return None
+        
+        return results[0] if results else None
+    
+    def _predict(self, text: str, k: int) -> Tuple[Tuple[str, float], ...]:
+        """
+        Run the model on preprocessed text (wrapped by the LRU cache).
+        
+        Returns:
+            Tuple of (language_code, probability) pairs
+        """
+        # FastText predict returns:
+        # labels: tuple of strings like ('__label__en',)
+        # probabilities: tuple of floats
+        labels, probabilities = self.model.predict(text, k=k)
+        
+        label_map = self._label_map
+        return tuple(
+            (label_map[label], float(prob))
+            for label, prob in zip(labels, probabilities)
+        )
+    
+    def _predict_or_cached(self, text: str, k: int) -> Tuple[Tuple[str, float], ...]:
+        """Predict through the LRU cache unless text is too long to keep."""
+        if len(text) > PREDICT_CACHE_MAX_LENGTH:
+            return self._predict(text, k)
+        return self._predict_cached(text, k)
+    
+    def cache_info(self):
+        """Get detection cache statistics (hits, misses, maxsize, currsize)."""
+        return self._predict_cached.cache_info()
+    
+    def cache_clear(self) -> None:
+        """Clear the detection cache."""
+        self._predict_cached.cache_clear()
+    
+    def detect_batch(
+        self,
+        texts: List[str],
+        k: int = 3,
+        n_jobs: int = 1
+    ) -> List[List[Tuple[str, float]]]:
         """
         Batch detect languages for multiple texts.
         
+        All non-empty texts are sent to FastText in a single predict() call,
+        so the per-text loop runs in C++ instead of Python. With n_jobs > 1,
+        batches of at least PARALLEL_MIN_BATCH texts are split into chunks
+        predicted on a thread pool (FastText releases the GIL in predict).
+        
         Args:
             texts: List of input texts
             k: Number of top predictions per text
+            n_jobs: Worker threads (-1 for os.cpu_count())
             
         Returns:
-            List of prediction lists
+            List of prediction lists (empty list for texts without letters)
+            
+        Raises:
+            ValueError: If any text is None
         """
-        results = []
-        for text in texts:
-            try:
-                predictions = self.detect(text, k=k)
-                results.append(predictions)
-            except Exception as e:
-                logger.error("Batch detection error", error=str(e))
-                results.append([])
+        batch, positions = self._prepare_batch(texts)
+        results: List[List[Tuple[str, float]]] = [[] for _ in texts]
+        
+        if not positions:
+            return results
+        
+        try:
+            labels_batch, probs_batch = self._predict_batch(batch, k, n_jobs)
+        except Exception as e:
+            logger.error("Batch detection error", error=str(e))
+            # Fall back to per-text detection so one bad input doesn't fail the batch
+            for i in positions:
+                results[i] = self.detect(texts[i], k=k)
+            return results
+        
+        label_map = self._label_map
+        for i, labels, probs in zip(positions, labels_batch, probs_batch):
+            results[i] = [
+                (label_map[label], float(prob))
+                for label, prob in zip(labels, probs)
+            ]
         
         return results
     
+    def detect_batch_arrays(
+        self,
+        texts: List[str],
+        k: int = 1,
+        n_jobs: int = 1
+    ) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Batch detect languages, returning NumPy arrays instead of tuples.
+        
+        Label ids index get_supported_languages() / get_label_by_id().
+        Rows for texts without letters (and unused slots when the model has
+        fewer than k labels) hold id -1 and probability 0.0.
+        
+        Args:
+            texts: List of input texts
+            k: Number of top predictions per text
+            n_jobs: Worker threads (-1 for os.cpu_count())
+            
+        Returns:
+            (label_ids, probs) arrays of shape (len(texts), k), dtypes
+            int16 and float32
+            
+        Raises:
+            ImportError: If numpy is not installed
+            ValueError: If any text is None
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError(
+                "numpy required for detect_batch_arrays. "
+                "Install with: pip install numpy"
+            )
+        
+        batch, positions = self._prepare_batch(texts)
+        label_ids = np.full((len(texts), k), -1, dtype=np.int16)
+        probs = np.zeros((len(texts), k), dtype=np.float32)
+        
+        if not positions:
+            return label_ids, probs
+        
+        labels_batch, probs_batch = self._predict_batch(batch, k, n_jobs)
+        
+        label_to_id = self._label_to_id
+        for row, labels, row_probs in zip(positions, labels_batch, probs_batch):
+            n = len(labels)
+            label_ids[row, :n] = [label_to_id[label] for label in labels]
+            probs[row, :n] = row_probs
+        
+        return label_ids, probs
+    
+    def get_label_by_id(self, label_id: int) -> str:
+        """Get the language code for a label id from detect_batch_arrays."""
+        return self._languages[label_id]
+    
+    def _prepare_batch(self, texts: List[str]) -> Tuple[List[str], List[int]]:
+        """
+        Clean a batch, dropping texts without letters.
+        
+        Returns:
+            (batch, positions): cleaned texts to predict and their indices
+            in the input list
+            
+        Raises:
+            ValueError: If any text is None
+        """
+        if any(text is None for text in texts):
+            raise ValueError("Input texts cannot contain None")
+        
+        cleaned = [_clean(text) for text in texts]
+        positions = [
+            i for i, text in enumerate(cleaned)
+            if text and _LETTER_RE.search(text)
+        ]
+        return [cleaned[i] for i in positions], positions
+    
+    def _predict_batch(self, batch: List[str], k: int, n_jobs: int) -> Tuple[list, list]:
+        """
+        Predict a cleaned batch, threading it when n_jobs > 1.
+        
+        Returns:
+            (labels_batch, probs_batch) in input order
+        """
+        if n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+        
+        if n_jobs > 1 and len(batch) >= self.PARALLEL_MIN_BATCH:
+            return self._predict_parallel(batch, k, n_jobs)
+        return self._predict_many(batch, k)
+    
+    def _predict_many(self, batch: List[str], k: int) -> Tuple[list, list]:
+        """
+        Predict a list of preprocessed, non-empty texts.
+        
+        Returns:
+            (labels_batch, probs_batch) as returned by FastText list predict
+        """
+        if self._native_batch:
+            return self.model.predict(batch, k=k)
+        
+        predictions = [self.model.predict(text, k=k) for text in batch]
+        return (
+            [labels for labels, _ in predictions],
+            [probs for _, probs in predictions]
+        )
+    
+    def _predict_parallel(self, batch: List[str], k: int, n_jobs: int) -> Tuple[list, list]:
+        """
+        Shard a batch into n_jobs chunks and predict them on a thread pool.
+        
+        Returns:
+            (labels_batch, probs_batch) in input order
+        """
+        chunk_size = -(-len(batch) // n_jobs)
+        chunks = [batch[i:i + chunk_size] for i in range(0, len(batch), chunk_size)]
+        
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            parts = list(executor.map(lambda chunk: self._predict_many(chunk, k), chunks))
+        
+        labels_batch: list = []
+        probs_batch: list = []
+        for labels, probs in parts:
+            labels_batch.extend(labels)
+            probs_batch.extend(probs)
+        return labels_batch, probs_batch
+    
     @staticmethod
     def train_custom_model(
         training_file: Path,
@@ -215,12 +653,26 @@ class FastTextDetector:
         epoch: int = 25,
         lr: float = 0.1,
         word_ngrams: int = 2,
-        loss: str = 'softmax'
+        loss: str = 'softmax',
+        thread: Optional[int] = None,
+        min_count: int = 1,
+        bucket: int = 2_000_000,
+        minn: int = 2,
+        maxn: int = 5,
+        quantize: bool = False,
+        cutoff: int = 100_000,
+        qnorm: bool = True,
+        retrain: bool = True
     ) -> 'fasttext.FastText._FastText':
         """
         Train custom FastText language detection model.
         Use this to extend to 250+ languages.
         
+        For web-scale corpora, GlotLID's settings are a good starting point:
+        min_count=1000, bucket=1_000_000, minn=2, maxn=5, dim=256. A high
+        min_count drops rare words and shrinks the model considerably; keep
+        the default of 1 for small corpora.
+        
         Args:
             training_file: Path to training data in FastText format:
                           __label__en This is English text
@@ -231,6 +683,16 @@ class FastTextDetector:
             lr: Learning rate (default: 0.1)
             word_ngrams: Use word n-grams (default: 2)
             loss: Loss function (default: 'softmax')
+            thread: Training threads (default: os.cpu_count())
+            min_count: Minimum word occurrences to keep a word (default: 1)
+            bucket: Hash buckets for word/char n-grams (default: 2,000,000)
+            minn: Min char n-gram length (default: 2)
+            maxn: Max char n-gram length (default: 5)
+            quantize: Product-quantize the model and save it as .ftz, making
+                     it 30-100x smaller for a small accuracy loss (default: False)
+            cutoff: Words/n-grams kept when quantizing (default: 100,000)
+            qnorm: Quantize vector norms separately (default: True)
+            retrain: Fine-tune embeddings after pruning (default: True)
             
         Returns:
             Trained FastText model
@@ -241,18 +703,22 @@ class FastTextDetector:
             ...     output_model=Path("models/custom/my_model.bin")
             ... )
         """
-        if not FASTTEXT_AVAILABLE:
-            raise ImportError("fasttext library not installed")
+        fasttext = _import_trainer()
         
         if not training_file.exists():
             raise FileNotFoundError(f"Training file not found: {training_file}")
         
+        if thread is None:
+            thread = os.cpu_count() or 1
+        
         logger.info(
             "Training custom FastText model",
             training_file=str(training_file),
             output_model=str(output_model),
             dim=dim,
-            epoch=epoch
+            epoch=epoch,
+            thread=thread,
+            min_count=min_count
         )
         
         # Train model
@@ -263,15 +729,30 @@ class FastTextDetector:
             lr=lr,
             wordNgrams=word_ngrams,
             loss=loss,
+            thread=thread,
+            minCount=min_count,
+            bucket=bucket,
+            minn=minn,
+            maxn=maxn,
             verbose=2
         )
         
+        if quantize:
+            model.quantize(
+                input=str(training_file),
+                qnorm=qnorm,
+                retrain=retrain,
+                cutoff=cutoff
+            )
+            output_model = output_model.with_suffix('.ftz')
+        
         # Save model
         output_model.parent.mkdir(parents=True, exist_ok=True)
         model.save_model(str(output_model))
         
         logger.info(
             "Custom model trained and saved",
+            quantized=quantize,
             output_model=str(output_model),
             num_labels=len(model.get_labels()),
             model_size_mb=output_model.stat().st_size / (1024 * 1024)
@@ -286,11 +767,9 @@ class FastTextDetector:
         Returns:
             List of ISO 639-1 language codes
         """
-        labels = self.model.get_labels()
-        # Extract language codes from '__label__en' format
-        return [label.replace('__label__', '') for label in labels]
+        return list(self._languages)
     
     def get_num_languages(self) -> int:
         """Get number of supported languages."""
-        return len(self.model.get_labels())
+        return len(self._labels)
 
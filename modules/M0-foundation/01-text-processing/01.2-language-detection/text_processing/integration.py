@@ -12,29 +12,67 @@ Example:
     روباه قهوه‌ای سریع fa Arab
 """
 
+import importlib.util
+import logging
+import os
 import sys
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# Task 01.1 sits in a directory that is not a valid package name and its
+# top-level package is also called text_processing, so it is loaded once
+# under its own module name instead of being put on sys.path
+_NORMALIZER_MODULE = "unicode_normalization"
+_NORMALIZER_PACKAGE_DIR = (
+    Path(__file__).parent.parent.parent / "01.1-unicode-normalization" / "text_processing"
+)
+
+
+def _load_normalizer():
+    """
+    Import the Task 01.1 text_processing package as unicode_normalization.
+    
+    Returns:
+        The loaded package module
+        
+    Raises:
+        ImportError: If the package cannot be found or fails to import
+    """
+    if _NORMALIZER_MODULE in sys.modules:
+        return sys.modules[_NORMALIZER_MODULE]
+    
+    spec = importlib.util.spec_from_file_location(
+        _NORMALIZER_MODULE,
+        _NORMALIZER_PACKAGE_DIR / "__init__.py",
+        submodule_search_locations=[str(_NORMALIZER_PACKAGE_DIR)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[_NORMALIZER_MODULE] = module
+    try:
+        spec.loader.exec_module(module)
+    except (ImportError, OSError) as e:
+        del sys.modules[_NORMALIZER_MODULE]
+        raise ImportError(f"Task 01.1 normalizer not available: {e}") from e
+    return module
 
-# Add Task 01.1 to path
-task_01_1_path = Path(__file__).parent.parent.parent / "01.1-unicode-normalization"
-if task_01_1_path.exists():
-    sys.path.insert(0, str(task_01_1_path))
 
 try:
-    from text_processing import normalize_universal, NormalizedText
+    _normalizer = _load_normalizer()
+    normalize_universal = _normalizer.normalize_universal
+    NormalizedText = _normalizer.NormalizedText
     NORMALIZER_AVAILABLE = True
 except ImportError:
     NORMALIZER_AVAILABLE = False
 
-from .language_detector import UniversalLanguageDetector, LanguageInfo
+from .language_detector import UniversalLanguageDetector, LanguageInfo, DATACLASS_SLOTS
 from shared.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProcessedText:
     """
     Complete text processing result.
@@ -83,7 +121,8 @@ class TextProcessingPipeline:
         self,
         use_normalizer: bool = True,
         model_path: Optional[Path] = None,
-        confidence_threshold: float = 0.7
+        confidence_threshold: float = 0.7,
+        thread_safe: bool = True
     ):
         """
         Initialize processing pipeline.
@@ -92,8 +131,13 @@ class TextProcessingPipeline:
             use_normalizer: Use Unicode normalizer from Task 01.1
             model_path: Path to FastText model (optional)
             confidence_threshold: Minimum confidence for language detection
+            thread_safe: Allow process_batch to predict large batches on a
+                        thread pool (FastText releases the GIL during predict)
         """
         self.use_normalizer = use_normalizer and NORMALIZER_AVAILABLE
+        self.thread_safe = thread_safe
+        # Checked once; see UniversalLanguageDetector._debug
+        self._debug = logger.is_enabled_for(logging.DEBUG)
         
         if self.use_normalizer and not NORMALIZER_AVAILABLE:
             logger.warning(
@@ -110,7 +154,8 @@ class TextProcessingPipeline:
         logger.info(
             "Pipeline initialized",
             use_normalizer=self.use_normalizer,
-            confidence_threshold=confidence_threshold
+            confidence_threshold=confidence_threshold,
+            thread_safe=thread_safe
         )
     
     def process(self, text: str) -> ProcessedText:
@@ -126,43 +171,62 @@ class TextProcessingPipeline:
         if text is None:
             raise ValueError("Input text cannot be None")
         
-        original_text = text
-        normalization_changes = []
-        
         # Step 1: Normalize text (Task 01.1)
-        if self.use_normalizer:
-            try:
-                normalized = normalize_universal(text)
-                text = normalized.text
-                normalization_changes = normalized.changes
-                
-                logger.debug(
-                    "Text normalized",
-                    original_length=len(original_text),
-                    normalized_length=len(text),
-                    num_changes=len(normalization_changes)
-                )
-            except Exception as e:
-                logger.error("Normalization failed", error=str(e))
-                # Continue with original text
-                text = original_text
+        normalized_text, normalization_changes, script_hint = self._normalize(text)
         
         # Step 2: Detect language (Task 01.2)
         try:
-            lang_info = self.detector.detect(text)
-            
-            logger.debug(
-                "Language detected",
-                language=lang_info.language_code,
-                confidence=lang_info.confidence,
-                script=lang_info.script_code
-            )
+            lang_info = self.detector.detect(normalized_text, script_hint=script_hint)
         except Exception as e:
             logger.error("Language detection failed", error=str(e))
+            lang_info = None
+        
+        # Step 3: Combine results
+        return self._combine(text, normalized_text, normalization_changes, lang_info)
+    
+    def _normalize(self, text: str) -> Tuple[str, list, Optional[str]]:
+        """
+        Normalize text with Task 01.1, falling back to the original on error.
+        
+        Returns:
+            (normalized_text, normalization_changes, script_hint); the hint
+            is the script the normalizer already scanned, or None
+        """
+        if not self.use_normalizer:
+            return text, [], None
+        
+        try:
+            normalized = normalize_universal(text)
+        except Exception as e:
+            logger.error("Normalization failed", error=str(e))
+            # Continue with original text
+            return text, [], None
+        
+        if self._debug:
+            logger.debug(
+                "Text normalized",
+                original_length=len(text),
+                normalized_length=len(normalized.text),
+                num_changes=len(normalized.changes)
+            )
+        
+        # The normalizer already scanned the script; reuse it
+        script_hint = normalized.script if normalized.script != "Zyyy" else None
+        return normalized.text, normalized.changes, script_hint
+    
+    def _combine(
+        self,
+        original_text: str,
+        normalized_text: str,
+        normalization_changes: list,
+        lang_info: Optional[LanguageInfo]
+    ) -> ProcessedText:
+        """Build the ProcessedText; lang_info None means detection failed."""
+        if lang_info is None:
             # Return with unknown language
             return ProcessedText(
                 original_text=original_text,
-                normalized_text=text,
+                normalized_text=normalized_text,
                 language_code="unknown",
                 script_code="Zyyy",
                 confidence=0.0,
@@ -172,10 +236,17 @@ class TextProcessingPipeline:
                 detection_method="error"
             )
         
-        # Step 3: Combine results
+        if self._debug:
+            logger.debug(
+                "Language detected",
+                language=lang_info.language_code,
+                confidence=lang_info.confidence,
+                script=lang_info.script_code
+            )
+        
         return ProcessedText(
             original_text=original_text,
-            normalized_text=text,
+            normalized_text=normalized_text,
             language_code=lang_info.language_code,
             script_code=lang_info.script_code,
             confidence=lang_info.confidence,
@@ -185,34 +256,77 @@ class TextProcessingPipeline:
             detection_method=lang_info.detection_method
         )
     
+    # Most FastText predict threads process_batch will use
+    MAX_WORKERS = 8
+    
     def process_batch(self, texts: list) -> list:
         """
         Process multiple texts through pipeline.
         
+        Texts are normalized one by one, then detected together with
+        UniversalLanguageDetector.detect_batch (one native FastText call).
+        When the pipeline is thread_safe and more than one CPU is available,
+        large batches are predicted on FastText's thread pool.
+        
         Args:
             texts: List of raw input texts
             
         Returns:
-            List of ProcessedText results
+            List of ProcessedText results (same order as input)
         """
-        results = []
-        for text in texts:
-            try:
-                result = self.process(text)
-                results.append(result)
-            except Exception as e:
-                logger.error("Batch processing error", error=str(e))
-                results.append(ProcessedText(
-                    original_text=text,
-                    normalized_text=text,
-                    language_code="unknown",
-                    script_code="Zyyy",
-                    confidence=0.0,
-                    normalization_changes=[],
-                    detected_languages=[]
-                ))
+        results: List[Optional[ProcessedText]] = [None] * len(texts)
+        positions = []
+        normalized_batch = []
+        
+        for i, text in enumerate(texts):
+            if text is None:
+                results[i] = self._process_safe(text)
+                continue
+            normalized_batch.append(self._normalize(text))
+            positions.append(i)
+        
+        if not positions:
+            return results
+        
+        n_jobs = min(self.MAX_WORKERS, os.cpu_count() or 1) if self.thread_safe else 1
+        try:
+            lang_infos = self.detector.detect_batch(
+                [normalized_text for normalized_text, _, _ in normalized_batch],
+                script_hints=[script_hint for _, _, script_hint in normalized_batch],
+                n_jobs=n_jobs
+            )
+        except Exception as e:
+            logger.error("Language detection failed", error=str(e))
+            lang_infos = [None] * len(positions)
+        
+        for i, (normalized_text, changes, _), lang_info in zip(
+            positions, normalized_batch, lang_infos
+        ):
+            results[i] = self._combine(texts[i], normalized_text, changes, lang_info)
         
         return results
+    
+    def _process_safe(self, text: str) -> ProcessedText:
+        """Process one text, returning an unknown result instead of raising."""
+        try:
+            return self.process(text)
+        except Exception as e:
+            logger.error("Batch processing error", error=str(e))
+            return ProcessedText(
+                original_text=text,
+                normalized_text=text,
+                language_code="unknown",
+                script_code="Zyyy",
+                confidence=0.0,
+                normalization_changes=[],
+                detected_languages=[]
+            )
+
+
+@lru_cache(maxsize=16)
+def _get_pipeline(frozen_kwargs: frozenset) -> TextProcessingPipeline:
+    """Build (once per distinct kwargs) the pipeline used by process_text."""
+    return TextProcessingPipeline(**dict(frozen_kwargs))
 
 
 # Convenience function
@@ -220,6 +334,8 @@ def process_text(text: str, **kwargs) -> ProcessedText:
     """
     Convenience function for one-off text processing.
     
+    Calls with the same kwargs share one pipeline (and its detector cache).
+    
     Args:
         text: Input text
         **kwargs: Arguments passed to TextProcessingPipeline
@@ -227,6 +343,8 @@ def process_text(text: str, **kwargs) -> ProcessedText:
     Returns:
         ProcessedText with complete processing results
     """
-    pipeline = TextProcessingPipeline(**kwargs)
-    return pipeline.process(text)
+    if kwargs.get('model_path') is not None:
+        # Path('m.bin') and 'm.bin' should hit the same pipeline
+        kwargs['model_path'] = str(kwargs['model_path'])
+    return _get_pipeline(frozenset(kwargs.items())).process(text)
 
@@ -8,17 +8,34 @@ Performance: 5000+ detections/second
 Accuracy: ≥95% on diverse corpus
 """
 
-import unicodedata
-from dataclasses import dataclass, field
+import logging
+import re
+import sys
+import threading
+import weakref
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterable, List, Literal, Tuple, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 from shared.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# slots=True drops the per-instance __dict__; the flag needs Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LanguageInfo:
     """
     Language detection result with metadata.
@@ -37,11 +54,174 @@ class LanguageInfo:
     is_mixed_content: bool = False
     detected_languages: List[Tuple[str, float]] = field(default_factory=list)
     detection_method: str = "fasttext"
+    
+    def as_array(self) -> "np.ndarray":
+        """
+        Return detected_languages as a NumPy structured array.
+        
+        Returns:
+            Array with 'lang' and 'score' fields; 'lang' is as wide as the
+            longest code and 'score' is float64, so nothing is truncated
+            
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for LanguageInfo.as_array()")
+        
+        width = max((len(lang) for lang, _ in self.detected_languages), default=1)
+        return np.array(
+            list(self.detected_languages),
+            dtype=[('lang', f'U{width}'), ('score', 'f8')]
+        )
+
+
+# Unicode blocks as (first code point, ISO 15924 code), sorted by start.
+# A code point belongs to the last block starting at or before it;
+# unlisted scripts, digits and symbols fall into 'Zyyy' (Common).
+_SCRIPT_BLOCKS = (
+    (0x0000, 'Zyyy'),
+    (0x0041, 'Latn'), (0x005B, 'Zyyy'), (0x0061, 'Latn'), (0x007B, 'Zyyy'),
+    (0x00C0, 'Latn'),   # Latin-1 letters, Extended-A/B, IPA
+    (0x02B0, 'Zyyy'),   # Modifier letters, combining marks
+    (0x0370, 'Grek'),
+    (0x0400, 'Cyrl'),   # Cyrillic + Supplement
+    (0x0530, 'Armn'),
+    (0x0590, 'Hebr'),
+    (0x0600, 'Arab'),
+    (0x0700, 'Zyyy'),   # Syriac
+    (0x0750, 'Arab'),   # Arabic Supplement
+    (0x0780, 'Zyyy'),   # Thaana, NKo, Samaritan, Mandaic
+    (0x0870, 'Arab'),   # Arabic Extended-B/A
+    (0x0900, 'Deva'),
+    (0x0980, 'Beng'),
+    (0x0A00, 'Zyyy'),   # Gurmukhi
+    (0x0A80, 'Gujr'),
+    (0x0B00, 'Zyyy'),   # Oriya
+    (0x0B80, 'Taml'),
+    (0x0C00, 'Telu'),
+    (0x0C80, 'Knda'),
+    (0x0D00, 'Mlym'),
+    (0x0D80, 'Sinh'),
+    (0x0E00, 'Thai'),
+    (0x0E80, 'Laoo'),
+    (0x0F00, 'Tibt'),
+    (0x1000, 'Mymr'),
+    (0x10A0, 'Geor'),
+    (0x1100, 'Kore'),   # Hangul Jamo
+    (0x1200, 'Ethi'),   # Ethiopic + Supplement
+    (0x13A0, 'Zyyy'),
+    (0x1780, 'Khmr'),
+    (0x1800, 'Zyyy'),
+    (0x19E0, 'Khmr'),   # Khmer Symbols
+    (0x1A00, 'Zyyy'),
+    (0x1C80, 'Cyrl'),   # Cyrillic Extended-C
+    (0x1C90, 'Geor'),   # Georgian Extended
+    (0x1CC0, 'Zyyy'),
+    (0x1D00, 'Latn'),   # Phonetic Extensions, Latin Extended Additional
+    (0x1F00, 'Grek'),   # Greek Extended
+    (0x2000, 'Zyyy'),
+    (0x2C60, 'Latn'),   # Latin Extended-C
+    (0x2C80, 'Zyyy'),
+    (0x2D00, 'Geor'),   # Georgian Supplement
+    (0x2D30, 'Zyyy'),
+    (0x2D80, 'Ethi'),   # Ethiopic Extended
+    (0x2DE0, 'Cyrl'),   # Cyrillic Extended-A
+    (0x2E00, 'Zyyy'),
+    (0x3040, 'Jpan'),   # Hiragana, Katakana
+    (0x3100, 'Zyyy'),   # Bopomofo
+    (0x3130, 'Kore'),   # Hangul Compatibility Jamo
+    (0x3190, 'Zyyy'),
+    (0x31F0, 'Jpan'),   # Katakana Phonetic Extensions
+    (0x3200, 'Zyyy'),
+    (0x3400, 'Hans'),   # CJK Extension A
+    (0x4DC0, 'Zyyy'),
+    (0x4E00, 'Hans'),   # CJK Unified Ideographs
+    (0xA000, 'Zyyy'),
+    (0xA640, 'Cyrl'),   # Cyrillic Extended-B
+    (0xA6A0, 'Zyyy'),
+    (0xA720, 'Latn'),   # Latin Extended-D
+    (0xA800, 'Zyyy'),
+    (0xA960, 'Kore'),   # Hangul Jamo Extended-A
+    (0xA980, 'Zyyy'),
+    (0xA9E0, 'Mymr'),   # Myanmar Extended-B
+    (0xAA00, 'Zyyy'),
+    (0xAA60, 'Mymr'),   # Myanmar Extended-A
+    (0xAA80, 'Zyyy'),
+    (0xAB00, 'Ethi'),   # Ethiopic Extended-A
+    (0xAB30, 'Latn'),   # Latin Extended-E
+    (0xAB70, 'Zyyy'),
+    (0xAC00, 'Kore'),   # Hangul Syllables, Jamo Extended-B
+    (0xD800, 'Zyyy'),
+    (0xF900, 'Hans'),   # CJK Compatibility Ideographs
+    (0xFB00, 'Latn'),   # Latin ligatures
+    (0xFB13, 'Zyyy'),
+    (0xFB1D, 'Hebr'),   # Hebrew presentation forms
+    (0xFB50, 'Arab'),   # Arabic Presentation Forms-A
+    (0xFE00, 'Zyyy'),
+    (0xFE70, 'Arab'),   # Arabic Presentation Forms-B
+    (0xFF00, 'Zyyy'),   # Fullwidth forms
+    (0xFF66, 'Jpan'),   # Halfwidth Katakana
+    (0xFFA0, 'Kore'),   # Halfwidth Hangul
+    (0xFFE0, 'Zyyy'),
+    (0x1AFF0, 'Jpan'),  # Kana Extended-B, Supplement, Extended-A
+    (0x1B170, 'Zyyy'),
+    (0x1E7E0, 'Ethi'),  # Ethiopic Extended-B
+    (0x1E800, 'Zyyy'),
+    (0x20000, 'Hans'),  # CJK Extensions B-F, Compatibility Supplement
+    (0x2FA20, 'Zyyy'),
+    (0x30000, 'Hans'),  # CJK Extensions G-H
+    (0x323B0, 'Zyyy'),
+)
+
+_BLOCK_STARTS = array('I', (start for start, _ in _SCRIPT_BLOCKS))
+_BLOCK_SCRIPTS = tuple(script for _, script in _SCRIPT_BLOCKS)
+
+# Everything except letters and digits (\W covers whitespace); one C-level
+# pass instead of an isalnum() call per character
+_NON_ALNUM_RE = re.compile(r'[\W_]+')
+
+# Below this length the per-call NumPy overhead outweighs the bisect loop
+_NUMPY_MIN_LEN = 64
+
+# Texts up to this length have their script and detection results memoized;
+# longer ones (whole documents) are rarely repeated and would only bloat
+# the caches
+DETECT_CACHE_MAX_LENGTH = 4096
+
+if NUMPY_AVAILABLE:
+    _SCRIPT_CODES = tuple(dict.fromkeys(_BLOCK_SCRIPTS))
+    _BLOCK_STARTS_NP = np.asarray(_BLOCK_STARTS, dtype=np.uint32)
+    _BLOCK_SCRIPT_IDS = np.array(
+        [_SCRIPT_CODES.index(script) for script in _BLOCK_SCRIPTS],
+        dtype=np.intp
+    )
+
+
+def _detect_script_numpy(letters: str) -> str:
+    """
+    Vectorized detect_script core for letters/digits-only text.
+    
+    Code points are bucketed with searchsorted over the block table and
+    counted with bincount. Ties go to the script seen first, as in the
+    scalar path.
+    """
+    cps = np.frombuffer(letters.encode('utf-32-le'), dtype=np.uint32)
+    ids = _BLOCK_SCRIPT_IDS[np.searchsorted(_BLOCK_STARTS_NP, cps, side='right') - 1]
+    counts = np.bincount(ids, minlength=len(_SCRIPT_CODES))
+    best = np.flatnonzero(counts == counts.max())
+    if len(best) > 1:
+        best = ids[np.isin(ids, best)]
+    return _SCRIPT_CODES[best[0]]
 
 
 def detect_script(text: str) -> str:
     """
-    Detect primary script of text using Unicode properties.
+    Detect primary script of text using Unicode block ranges.
+    
+    Each letter/digit is mapped to its block's script with a binary search
+    over _BLOCK_STARTS (O(log R) per character). Longer texts run the same
+    lookup vectorized with NumPy when it is installed.
     
     Args:
         text: Input text
@@ -49,56 +229,168 @@ def detect_script(text: str) -> str:
     Returns:
         ISO 15924 script code (e.g., 'Arab', 'Latn', 'Hans')
     """
+    if text and len(text) > DETECT_CACHE_MAX_LENGTH:
+        return _scan_script(text)
+    return _cached_script(text)
+
+
+@lru_cache(maxsize=16384)
+def _cached_script(text: str) -> str:
+    """Memoized _scan_script for texts up to DETECT_CACHE_MAX_LENGTH."""
+    return _scan_script(text)
+
+
+def _scan_script(text: str) -> str:
+    """Uncached detect_script core."""
     if not text:
         return "Zyyy"  # Common
     
-    # Count characters per script
-    script_counts = {}
-    for char in text:
-        if char.isspace() or not char.isalnum():
-            continue
-        try:
-            script = unicodedata.name(char).split()[0]
-            script_counts[script] = script_counts.get(script, 0) + 1
-        except ValueError:
-            continue
-    
-    if not script_counts:
+    letters = _NON_ALNUM_RE.sub('', text)
+    if not letters:
         return "Zyyy"
     
+    if NUMPY_AVAILABLE and len(letters) >= _NUMPY_MIN_LEN:
+        return _detect_script_numpy(letters)
+    
+    # Count characters per script; most_common keeps first-seen order on ties
+    starts = _BLOCK_STARTS
+    scripts = _BLOCK_SCRIPTS
+    script_counts = Counter([scripts[bisect_right(starts, cp) - 1] for cp in map(ord, letters)])
+    
     # Get most common script
-    primary_script = max(script_counts, key=script_counts.get)
+    return script_counts.most_common(1)[0][0]
+
+
+# Languages written in a single script, so a prediction fixes the script
+# without scanning the text. Codes match what detect_script returns.
+_LANG_SCRIPT = {
+    **dict.fromkeys((
+        'en', 'fr', 'de', 'es', 'it', 'pt', 'nl', 'sv', 'da', 'no', 'nb',
+        'fi', 'pl', 'cs', 'sk', 'sl', 'hr', 'hu', 'ro', 'tr', 'id', 'vi',
+        'ca', 'et', 'lv', 'lt', 'is', 'ga', 'cy', 'eu', 'gl', 'sq', 'af',
+        'sw', 'tl', 'mt', 'lb', 'eo', 'la',
+    ), 'Latn'),
+    **dict.fromkeys(('ru', 'uk', 'bg', 'be', 'mk', 'kk', 'ky', 'tg'), 'Cyrl'),
+    **dict.fromkeys(('ar', 'fa', 'ur', 'ps', 'ckb', 'ug'), 'Arab'),
+    **dict.fromkeys(('hi', 'mr', 'ne', 'sa'), 'Deva'),
+    **dict.fromkeys(('bn', 'as'), 'Beng'),
+    **dict.fromkeys(('he', 'yi'), 'Hebr'),
+    'el': 'Grek',
+    'zh': 'Hans',
+    'ja': 'Jpan',
+    'ko': 'Kore',
+    'th': 'Thai',
+    'lo': 'Laoo',
+    'km': 'Khmr',
+    'my': 'Mymr',
+    'ka': 'Geor',
+    'hy': 'Armn',
+    'am': 'Ethi',
+    'bo': 'Tibt',
+    'gu': 'Gujr',
+    'ta': 'Taml',
+    'te': 'Telu',
+    'kn': 'Knda',
+    'ml': 'Mlym',
+    'si': 'Sinh',
+}
+
+# Prefix scanned when the language does not pin down the script
+_SCRIPT_SAMPLE_LEN = 256
+
+# Texts shorter than this (after stripping) use the n-gram fallback
+_SHORT_TEXT_LEN = 20
+
+
+def _is_short_text(text: str) -> bool:
+    """
+    Check whether text is shorter than _SHORT_TEXT_LEN once stripped.
     
-    # Map to ISO 15924 codes
-    script_map = {
-        'ARABIC': 'Arab',
-        'LATIN': 'Latn',
-        'CYRILLIC': 'Cyrl',
-        'CJK': 'Hans',
-        'HIRAGANA': 'Jpan',
-        'KATAKANA': 'Jpan',
-        'HANGUL': 'Kore',
-        'DEVANAGARI': 'Deva',
-        'HEBREW': 'Hebr',
-        'GREEK': 'Grek',
-        'THAI': 'Thai',
-        'ARMENIAN': 'Armn',
-        'GEORGIAN': 'Geor',
-        'BENGALI': 'Beng',
-        'GUJARATI': 'Gujr',
-        'TAMIL': 'Taml',
-        'TELUGU': 'Telu',
-        'KANNADA': 'Knda',
-        'MALAYALAM': 'Mlym',
-        'SINHALA': 'Sinh',
-        'MYANMAR': 'Mymr',
-        'KHMER': 'Khmr',
-        'LAO': 'Laoo',
-        'TIBETAN': 'Tibt',
-        'ETHIOPIC': 'Ethi',
-    }
+    Only copies the string with strip() when it is long enough to matter
+    and actually starts or ends with whitespace.
+    """
+    if len(text) < _SHORT_TEXT_LEN:
+        return True
+    if not (text[0].isspace() or text[-1].isspace()):
+        return False
+    return len(text.strip()) < _SHORT_TEXT_LEN
+
+
+# Loaded FastText models shared by every detector in the process, keyed by
+# model path ("default" for the built-in search order)
+_MODEL_CACHE = {}
+_MODEL_LOCK = threading.Lock()
+
+
+def _model_key(
+    model_path: Optional[Path],
+    low_memory: bool = False,
+    model_variant: str = 'ftz'
+) -> str:
+    """Build the _MODEL_CACHE key for a model path and default-search options."""
+    if model_path:
+        return str(model_path)
+    if low_memory:
+        return "default:low_memory"
+    return "default" if model_variant == 'ftz' else f"default:{model_variant}"
+
+
+def _get_shared_fasttext(
+    model_path: Optional[Path],
+    low_memory: bool = False,
+    model_variant: str = 'ftz'
+):
+    """
+    Get the process-wide FastTextDetector for a model path, loading it once.
     
-    return script_map.get(primary_script, 'Zyyy')
+    Args:
+        model_path: Path to FastText model (None for default search)
+        low_memory: Restrict the default search to quantized models
+        model_variant: Default model to prefer ('ftz' or 'bin')
+        
+    Returns:
+        Shared FastTextDetector instance
+    """
+    key = _model_key(model_path, low_memory, model_variant)
+    with _MODEL_LOCK:
+        detector = _MODEL_CACHE.get(key)
+        if detector is None:
+            from .fasttext_detector import FastTextDetector
+            detector = FastTextDetector(
+                model_path,
+                low_memory=low_memory,
+                model_variant=model_variant
+            )
+            _MODEL_CACHE[key] = detector
+        return detector
+
+
+def release_model(
+    model_path: Optional[Path] = None,
+    low_memory: Optional[bool] = None,
+    model_variant: Optional[str] = None
+) -> None:
+    """
+    Drop shared FastText models so their memory can be reclaimed.
+    
+    Detectors that already hold a model keep using it; new detectors
+    load it again on first use. With no arguments every shared model is
+    released; otherwise the one keyed by the same options as
+    _get_shared_fasttext.
+    
+    Args:
+        model_path: Model to release (None for a default-search model)
+        low_memory: low_memory option the model was loaded with
+        model_variant: model_variant option the model was loaded with
+    """
+    with _MODEL_LOCK:
+        if model_path is None and low_memory is None and model_variant is None:
+            _MODEL_CACHE.clear()
+        else:
+            _MODEL_CACHE.pop(
+                _model_key(model_path, bool(low_memory), model_variant or 'ftz'),
+                None
+            )
 
 
 class UniversalLanguageDetector:
@@ -130,7 +422,11 @@ class UniversalLanguageDetector:
         model_path: Optional[Path] = None,
         use_fallback: bool = True,
         confidence_threshold: float = 0.7,
-        top_k: int = 3
+        top_k: int = 3,
+        cache_size: int = 100_000,
+        low_memory: bool = False,
+        allowed_languages: Optional[Iterable[str]] = None,
+        model_variant: Literal['ftz', 'bin'] = 'ftz'
     ):
         """
         Initialize language detector.
@@ -140,10 +436,29 @@ class UniversalLanguageDetector:
             use_fallback: Use n-gram fallback for short texts
             confidence_threshold: Minimum confidence for reliable detection
             top_k: Number of top predictions to consider
+            cache_size: Max texts kept in the detection LRU cache
+                       (0 disables caching)
+            low_memory: Load only quantized models (lid.176.ftz, ~1MB)
+                       instead of falling back to lid.176.bin (~126MB)
+            allowed_languages: Restrict results to these language codes;
+                       probabilities are renormalized over the allowed set
+            model_variant: Default model to prefer when model_path is None:
+                       'ftz' (quantized lid.176.ftz) or 'bin' (lid.176.bin)
         """
         self.confidence_threshold = confidence_threshold
         self.top_k = top_k
         self.use_fallback = use_fallback
+        self.low_memory = low_memory
+        self.model_variant = model_variant
+        self.allowed_languages = (
+            frozenset(allowed_languages) if allowed_languages is not None else None
+        )
+        # With a language filter, over-fetch so enough allowed languages
+        # survive filtering to fill top_k
+        self._predict_k = (
+            max(top_k, 3 * len(self.allowed_languages))
+            if self.allowed_languages is not None else top_k
+        )
         
         # Lazy load FastText detector
         self._fasttext_detector = None
@@ -152,6 +467,16 @@ class UniversalLanguageDetector:
         # Lazy load n-gram detector
         self._ngram_detector = None
         
+        # Per-instance cache of text -> LanguageInfo; detect() hands out
+        # copies so callers can't modify the cached entries. It holds a weak
+        # proxy so the cache doesn't keep the detector in a reference cycle.
+        self._detect_cached = lru_cache(maxsize=cache_size)(
+            partial(type(self)._detect, weakref.proxy(self))
+        )
+        # Debug level is fixed when the logger is configured; checking it once
+        # keeps debug-only arguments from being built on every call
+        self._debug = logger.is_enabled_for(logging.DEBUG)
+        
         logger.info(
             "Language detector initialized",
             model_path=str(model_path) if model_path else "default",
@@ -161,26 +486,45 @@ class UniversalLanguageDetector:
     
     @property
     def fasttext_detector(self):
-        """Lazy load FastText detector."""
+        """Lazy load FastText detector (shared by all detectors using the same model)."""
         if self._fasttext_detector is None:
-            from .fasttext_detector import FastTextDetector
-            self._fasttext_detector = FastTextDetector(self._model_path)
+            self._fasttext_detector = _get_shared_fasttext(
+                self._model_path, self.low_memory, self.model_variant
+            )
         return self._fasttext_detector
     
     @property
     def ngram_detector(self):
-        """Lazy load n-gram detector."""
+        """
+        Lazy load n-gram detector.
+        
+        Returns None when the fallback is disabled or the optional
+        langdetect dependency is not installed (pip install .[fallback]).
+        """
         if self.use_fallback and self._ngram_detector is None:
+            try:
+                from langdetect import detect_langs  # noqa: F401
+            except ImportError:
+                logger.info(
+                    "langdetect not installed, short texts will use FastText",
+                    install_hint="pip install .[fallback]"
+                )
+                self.use_fallback = False
+                return None
+            
             from .ngram_detector import NgramDetector
             self._ngram_detector = NgramDetector()
         return self._ngram_detector
     
-    def detect(self, text: str) -> LanguageInfo:
+    def detect(self, text: str, script_hint: Optional[str] = None) -> LanguageInfo:
         """
         Detect language of text with confidence scoring.
         
         Args:
             text: Input text (any language)
+            script_hint: ISO 15924 code already known for text (e.g. from
+                        normalization); used instead of scanning the text
+                        when the detected language has no fixed script
             
         Returns:
             LanguageInfo with language code, script, and confidence
@@ -191,7 +535,7 @@ class UniversalLanguageDetector:
         if text is None:
             raise ValueError("Input text cannot be None")
         
-        if not text.strip():
+        if not text or text.isspace():
             return LanguageInfo(
                 language_code="unknown",
                 script_code="Zyyy",
@@ -201,60 +545,10 @@ class UniversalLanguageDetector:
                 detection_method="none"
             )
         
-        # Detect script first
-        script = detect_script(text)
-        
-        # Choose detection method based on text length
-        text_len = len(text.strip())
-        
         try:
-            if text_len < 20 and self.use_fallback:
-                # Use n-gram for very short text
-                predictions = self.ngram_detector.detect(text, k=self.top_k)
-                method = "ngram"
-            else:
-                # Use FastText (primary method)
-                predictions = self.fasttext_detector.detect(text, k=self.top_k)
-                method = "fasttext"
-            
-            if not predictions:
-                return LanguageInfo(
-                    language_code="unknown",
-                    script_code=script,
-                    confidence=0.0,
-                    is_mixed_content=False,
-                    detected_languages=[],
-                    detection_method=method
-                )
-            
-            # Primary language is top prediction
-            primary_lang, primary_conf = predictions[0]
-            
-            # Check for mixed content
-            is_mixed = (
-                len(predictions) > 1 and
-                predictions[1][1] > 0.2  # Second language has >20% confidence
-            )
-            
-            logger.debug(
-                "Language detected",
-                text_preview=text[:50],
-                language=primary_lang,
-                confidence=primary_conf,
-                script=script,
-                is_mixed=is_mixed,
-                method=method
-            )
-            
-            return LanguageInfo(
-                language_code=primary_lang,
-                script_code=script,
-                confidence=primary_conf,
-                is_mixed_content=is_mixed,
-                detected_languages=predictions,
-                detection_method=method
-            )
-            
+            if len(text) > DETECT_CACHE_MAX_LENGTH:
+                return self._detect(text, script_hint)
+            cached = self._detect_cached(text, script_hint)
         except Exception as e:
             logger.error(
                 "Language detection failed",
@@ -264,41 +558,203 @@ class UniversalLanguageDetector:
             # Return unknown on error (zero crashes requirement)
             return LanguageInfo(
                 language_code="unknown",
-                script_code=script,
+                script_code=script_hint or detect_script(text),
                 confidence=0.0,
                 is_mixed_content=False,
                 detected_languages=[],
                 detection_method="error"
             )
+        return replace(cached, detected_languages=list(cached.detected_languages))
+    
+    def _detect(self, text: str, script_hint: Optional[str] = None) -> LanguageInfo:
+        """
+        Detect language of non-empty text (wrapped by the LRU cache).
+        
+        Exceptions propagate so failed detections are never cached.
+        """
+        # Choose detection method based on text length
+        if _is_short_text(text) and self.ngram_detector is not None:
+            # Use n-gram for very short text
+            predictions = self.ngram_detector.detect(text, k=self._predict_k)
+            method = "ngram"
+        elif self.top_k == 1 and self.allowed_languages is None:
+            # No alternates needed, skip the top-k sort
+            top = self.fasttext_detector.detect_top1(text)
+            predictions = [top] if top else []
+            method = "fasttext"
+        else:
+            # Use FastText (primary method)
+            predictions = self.fasttext_detector.detect(text, k=self._predict_k)
+            method = "fasttext"
+        
+        return self._build_info(text, script_hint, predictions, method)
+    
+    def _build_info(
+        self,
+        text: str,
+        script: Optional[str],
+        predictions: List[Tuple[str, float]],
+        method: str
+    ) -> LanguageInfo:
+        """
+        Build a LanguageInfo from ranked predictions.
+        
+        Args:
+            text: Input text (for debug logging)
+            script: ISO 15924 script hint, or None; the primary language's
+                   script takes precedence, then the hint, then a scan of
+                   the text
+            predictions: (language_code, probability) pairs, best first
+            method: Detection method used
+            
+        Returns:
+            LanguageInfo (language "unknown" if there are no predictions)
+        """
+        if self.allowed_languages is not None:
+            predictions = self._restrict(predictions)
+        
+        if not predictions:
+            return LanguageInfo(
+                language_code="unknown",
+                script_code=script or detect_script(text[:_SCRIPT_SAMPLE_LEN]),
+                confidence=0.0,
+                is_mixed_content=False,
+                detected_languages=[],
+                detection_method=method
+            )
+        
+        # Primary language is top prediction
+        primary_lang, primary_conf = predictions[0]
+        
+        # The language fixes the script more reliably than a character-level
+        # hint (Japanese text full of kanji still maps to Jpan, not Hans)
+        script = (
+            _LANG_SCRIPT.get(primary_lang)
+            or script
+            or detect_script(text[:_SCRIPT_SAMPLE_LEN])
+        )
+        
+        # Check for mixed content
+        is_mixed = (
+            len(predictions) > 1 and
+            predictions[1][1] > 0.2  # Second language has >20% confidence
+        )
+        
+        if self._debug:
+            logger.debug(
+                "Language detected",
+                text_preview=text[:50],
+                language=primary_lang,
+                confidence=primary_conf,
+                script=script,
+                is_mixed=is_mixed,
+                method=method
+            )
+        
+        return LanguageInfo(
+            language_code=primary_lang,
+            script_code=script,
+            confidence=primary_conf,
+            is_mixed_content=is_mixed,
+            detected_languages=predictions,
+            detection_method=method
+        )
     
-    def detect_batch(self, texts: List[str]) -> List[LanguageInfo]:
+    def _restrict(self, predictions: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
+        """
+        Keep allowed languages only, renormalized to sum to 1.0.
+        
+        Args:
+            predictions: (language_code, probability) pairs, best first
+            
+        Returns:
+            Top-k allowed predictions
+        """
+        allowed = [(lang, prob) for lang, prob in predictions if lang in self.allowed_languages]
+        total = sum(prob for _, prob in allowed)
+        if total <= 0:
+            return []
+        return [(lang, prob / total) for lang, prob in allowed[:self.top_k]]
+    
+    def cache_info(self):
+        """Get detection cache statistics (hits, misses, maxsize, currsize)."""
+        return self._detect_cached.cache_info()
+    
+    def cache_clear(self) -> None:
+        """Clear the detection cache."""
+        self._detect_cached.cache_clear()
+    
+    def detect_batch(
+        self,
+        texts: List[str],
+        script_hints: Optional[List[Optional[str]]] = None,
+        n_jobs: int = 1
+    ) -> List[LanguageInfo]:
         """
         Batch detect languages for multiple texts.
         
+        Texts routed to FastText are predicted together through
+        FastTextDetector.detect_batch (one native call); short texts that
+        use the n-gram fallback, empty texts and None go through detect().
+        
         Args:
             texts: List of input texts
+            script_hints: Per-text script hints, as for detect() (optional)
+            n_jobs: FastText predict threads (-1 for os.cpu_count())
             
         Returns:
             List of LanguageInfo objects
         """
-        results = []
-        for text in texts:
+        if script_hints is None:
+            script_hints = [None] * len(texts)
+        results: List[Optional[LanguageInfo]] = [None] * len(texts)
+        fasttext_positions = []
+        
+        for i, text in enumerate(texts):
+            if (
+                text and not text.isspace()
+                and not (_is_short_text(text) and self.ngram_detector is not None)
+            ):
+                fasttext_positions.append(i)
+            else:
+                results[i] = self._detect_or_error(text, script_hints[i])
+        
+        if fasttext_positions:
+            batch = [texts[i] for i in fasttext_positions]
             try:
-                result = self.detect(text)
-                results.append(result)
+                predictions_batch = self.fasttext_detector.detect_batch(
+                    batch, k=self._predict_k, n_jobs=n_jobs
+                )
             except Exception as e:
                 logger.error("Batch detection error", error=str(e))
-                results.append(LanguageInfo(
-                    language_code="unknown",
-                    script_code="Zyyy",
-                    confidence=0.0,
-                    is_mixed_content=False,
-                    detected_languages=[],
-                    detection_method="error"
-                ))
+                predictions_batch = None
+            
+            if predictions_batch is None:
+                for i in fasttext_positions:
+                    results[i] = self._detect_or_error(texts[i], script_hints[i])
+            else:
+                for i, predictions in zip(fasttext_positions, predictions_batch):
+                    results[i] = self._build_info(
+                        texts[i], script_hints[i], predictions, "fasttext"
+                    )
         
         return results
     
+    def _detect_or_error(self, text: str, script_hint: Optional[str] = None) -> LanguageInfo:
+        """Run detect(), mapping any exception to an 'error' LanguageInfo."""
+        try:
+            return self.detect(text, script_hint)
+        except Exception as e:
+            logger.error("Batch detection error", error=str(e))
+            return LanguageInfo(
+                language_code="unknown",
+                script_code="Zyyy",
+                confidence=0.0,
+                is_mixed_content=False,
+                detected_languages=[],
+                detection_method="error"
+            )
+    
     def is_reliable(self, language_info: LanguageInfo) -> bool:
         """
         Check if detection is reliable based on confidence threshold.
@@ -7,20 +7,160 @@ Uses character n-gram profiles for language identification.
 This is a lightweight fallback, not meant to replace FastText for normal texts.
 """
 
+import logging
 import re
-from collections import Counter
-from typing import List, Tuple, Dict
+import threading
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, Tuple, Dict, Optional
 
 try:
     from langdetect import detect_langs, LangDetectException
+    from langdetect import detector_factory
     LANGDETECT_AVAILABLE = True
 except ImportError:
     LANGDETECT_AVAILABLE = False
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from shared.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Same smoothing as langdetect's Detector (alpha / BASE_FREQ added to every n-gram prob)
+_SMOOTHING = 0.5 / 10000
+
+_PROFILE = None
+_PROFILE_LOCK = threading.Lock()
+
+
+def _load_profile():
+    """
+    Build the vectorized n-gram profile from langdetect's bundled profiles.
+    
+    Returns:
+        Tuple of (languages, ngram -> row index, float32 log-prob matrix of
+        shape [num_ngrams, num_languages])
+    """
+    global _PROFILE
+    with _PROFILE_LOCK:
+        if _PROFILE is None:
+            detector_factory.init_factory()
+            factory = detector_factory._factory
+            word_probs = factory.word_lang_prob_map
+            
+            matrix = np.array(list(word_probs.values()), dtype=np.float32)
+            np.log(matrix + np.float32(_SMOOTHING), out=matrix)
+            index = {word: row for row, word in enumerate(word_probs)}
+            
+            _PROFILE = (tuple(factory.langlist), index, matrix)
+            logger.info(
+                "N-gram profile loaded",
+                num_ngrams=len(index),
+                num_languages=len(factory.langlist)
+            )
+    return _PROFILE
+
+
+@lru_cache(maxsize=None)
+def _langdetect_internals_available() -> bool:
+    """
+    Check the private langdetect API that _load_profile and
+    _detect_vectorized rely on.
+    
+    Only langdetect's public detect_langs is covered by its version
+    requirement; if a release renames these internals, NgramDetector
+    falls back to detect_langs instead of failing every detection.
+    
+    Returns:
+        True if the factory profile and n-gram extraction internals exist
+    """
+    try:
+        detector_factory.init_factory()
+        factory = detector_factory._factory
+        detector = factory.create()
+    except (AttributeError, TypeError):
+        return False
+    return (
+        all(hasattr(factory, name) for name in ('word_lang_prob_map', 'langlist'))
+        and all(hasattr(detector, name) for name in ('append', 'cleaning_text', '_extract_ngrams'))
+    )
+
+
+def _detect_vectorized(text: str, k: int) -> List[Tuple[str, float]]:
+    """
+    Score all n-grams of text at once against the profile matrix.
+    
+    Sums the per-language log probabilities of every known 1-3 char
+    n-gram (the expectation of langdetect's sampled updates) and
+    applies a softmax. The ranking is deterministic, but the scores are
+    not langdetect's: detect_langs reports roughly the share of its
+    trials each language wins, so it is far more confident on short
+    texts, and the two can disagree on the top language.
+    
+    Args:
+        text: Input text
+        k: Number of top predictions to return
+        
+    Returns:
+        List of (language_code, probability) tuples
+    """
+    languages, index, matrix = _load_profile()
+    
+    # Reuse langdetect's URL/e-mail stripping and n-gram normalization
+    extractor = detector_factory._factory.create()
+    extractor.append(text)
+    extractor.cleaning_text()
+    ngrams = extractor._extract_ngrams()
+    if not ngrams:
+        return []
+    
+    rows = np.fromiter((index[w] for w in ngrams), dtype=np.intp, count=len(ngrams))
+    scores = matrix[rows].sum(axis=0, dtype=np.float64)
+    scores = np.exp(scores - scores.max())
+    scores /= scores.sum()
+    
+    k = min(k, len(languages))
+    top = np.argpartition(scores, -k)[-k:]
+    top = top[np.argsort(scores[top])[::-1]]
+    return [(languages[i], float(scores[i])) for i in top]
+
+
+@lru_cache(maxsize=10000)
+def _cached_detect(text: str, k: int, vectorized: bool) -> Tuple[Tuple[str, float], ...]:
+    """
+    Memoized n-gram detection core; short queries repeat a lot.
+    
+    Exceptions are not cached, so failed detections are retried.
+    
+    Args:
+        text: Non-blank input text
+        k: Number of top predictions to return
+        vectorized: Use the NumPy profile scorer instead of detect_langs
+        
+    Returns:
+        Tuple of (language_code, probability) tuples
+    """
+    if vectorized:
+        return tuple(_detect_vectorized(text, k))
+    
+    # langdetect returns list of Language objects
+    results = detect_langs(text)
+    
+    # Convert to our format and limit to k results
+    return tuple((lang.lang, lang.prob) for lang in results[:k])
+
 
 class NgramDetector:
     """
@@ -33,6 +173,8 @@ class NgramDetector:
     - Fast detection for short texts
     - 55+ languages supported
     - Probabilistic approach
+    - Optional deterministic NumPy scoring over langdetect's profiles
+      (vectorized=True; faster, but not calibrated like detect_langs)
     
     Example:
         >>> detector = NgramDetector()
@@ -41,8 +183,18 @@ class NgramDetector:
         [('en', 0.87), ('fr', 0.08), ('de', 0.05)]
     """
     
-    def __init__(self):
-        """Initialize n-gram detector."""
+    def __init__(self, vectorized: bool = False):
+        """
+        Initialize n-gram detector.
+        
+        Args:
+            vectorized: Score with the NumPy profile matrix instead of
+                       detect_langs. Much faster and deterministic, but its
+                       confidences are lower and its top-1 can differ, so
+                       is_reliable thresholds tuned on detect_langs don't
+                       carry over. Ignored without NumPy or when langdetect's
+                       internals are missing.
+        """
         if not LANGDETECT_AVAILABLE:
             logger.warning(
                 "langdetect library not available. "
@@ -51,7 +203,19 @@ class NgramDetector:
             )
         
         self.available = LANGDETECT_AVAILABLE
-        logger.info("N-gram detector initialized", available=self.available)
+        self.vectorized = vectorized and LANGDETECT_AVAILABLE and NUMPY_AVAILABLE
+        if self.vectorized and not _langdetect_internals_available():
+            logger.warning(
+                "langdetect internals changed, using detect_langs instead "
+                "of the vectorized scorer"
+            )
+            self.vectorized = False
+        self._debug = logger.is_enabled_for(logging.DEBUG)
+        logger.info(
+            "N-gram detector initialized",
+            available=self.available,
+            vectorized=self.vectorized
+        )
     
     def detect(self, text: str, k: int = 3) -> List[Tuple[str, float]]:
         """
@@ -62,7 +226,8 @@ class NgramDetector:
             k: Number of top predictions to return
             
         Returns:
-            List of (language_code, probability) tuples
+            List of (language_code, probability) tuples; a fresh shallow
+            copy of the cached immutable result, safe to modify
         """
         if not self.available:
             logger.warning("N-gram detector not available, returning empty")
@@ -72,20 +237,14 @@ class NgramDetector:
             return []
         
         try:
-            # langdetect returns list of Language objects
-            results = detect_langs(text)
-            
-            # Convert to our format and limit to k results
-            predictions = [
-                (lang.lang, lang.prob)
-                for lang in results[:k]
-            ]
+            predictions = list(_cached_detect(text, k, self.vectorized))
             
-            logger.debug(
-                "N-gram detection",
-                text_preview=text[:50],
-                top_prediction=predictions[0] if predictions else None
-            )
+            if self._debug:
+                logger.debug(
+                    "N-gram detection",
+                    text_preview=text[:50],
+                    top_prediction=predictions[0] if predictions else None
+                )
             
             return predictions
             
@@ -107,6 +266,97 @@ class NgramDetector:
     def is_available(self) -> bool:
         """Check if n-gram detector is available."""
         return self.available
+    
+    # Results are cached per process, shared by all NgramDetector instances
+    cache_info = staticmethod(_cached_detect.cache_info)
+    clear_cache = staticmethod(_cached_detect.cache_clear)
+
+
+# bmp_table entry for code points outside every script range
+_NO_SCRIPT = 0xFF
+
+
+def _script_intervals(script_ranges: Dict[str, Tuple[int, int]]):
+    """
+    Flatten inclusive script ranges into a sorted interval lookup table.
+    
+    Args:
+        script_ranges: Script name -> (start, end) code point range
+        
+    Returns:
+        Tuple of (boundaries, interval_ids, bmp_table): sorted interval
+        starts (array('I'), for bisect/searchsorted), for each interval the
+        index of its script in script_ranges or -1 for gaps, and a 64KB
+        bytes table giving every BMP code point's script index directly
+        (_NO_SCRIPT for gaps)
+    """
+    # Whitespace is never counted, so it is carved out of the ranges as gaps
+    # (all Unicode whitespace is at or below U+3000)
+    whitespace = [cp for cp in range(0x3001) if chr(cp).isspace()]
+    
+    boundaries = [0]
+    interval_ids = [-1]
+    ordered = sorted(
+        (start, end, script_id)
+        for script_id, (start, end) in enumerate(script_ranges.values())
+    )
+    for start, end, script_id in ordered:
+        pieces = []
+        low = start
+        for cp in whitespace:
+            if start <= cp <= end:
+                if cp > low:
+                    pieces.append((low, cp - 1))
+                low = cp + 1
+        if low <= end:
+            pieces.append((low, end))
+        
+        for piece_start, piece_end in pieces:
+            if piece_start != boundaries[-1]:
+                boundaries.append(piece_start)
+                interval_ids.append(script_id)
+            else:
+                interval_ids[-1] = script_id
+            boundaries.append(piece_end + 1)
+            interval_ids.append(-1)
+    
+    bmp_table = bytearray([_NO_SCRIPT]) * 0x10000
+    for start, end, script_id in zip(boundaries, boundaries[1:] + [0x10000], interval_ids):
+        if script_id >= 0 and start < 0x10000:
+            end = min(end, 0x10000)
+            bmp_table[start:end] = bytes([script_id]) * (end - start)
+    
+    return array('I', boundaries), tuple(interval_ids), bytes(bmp_table)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _classify_scripts(cps, bmp_table, boundaries, interval_ids, n_scripts):
+        """
+        Count code points per script in one compiled pass.
+        
+        Returns:
+            Tuple of (counts, first_seen): per-script character counts and
+            the position of each script's first character (len(cps) if
+            the script never occurs), used to break ties
+        """
+        n = cps.shape[0]
+        counts = np.zeros(n_scripts, dtype=np.int64)
+        first_seen = np.full(n_scripts, n, dtype=np.int64)
+        for i in range(n):
+            c = cps[i]
+            if c < 0x10000:
+                script_id = np.int64(bmp_table[c])
+                if script_id == _NO_SCRIPT:
+                    continue
+            else:
+                script_id = interval_ids[np.searchsorted(boundaries, c, side='right') - 1]
+                if script_id < 0:
+                    continue
+            if counts[script_id] == 0:
+                first_seen[script_id] = i
+            counts[script_id] += 1
+        return counts, first_seen
 
 
 class SimpleNgramDetector:
@@ -115,6 +365,8 @@ class SimpleNgramDetector:
     
     This is a minimal implementation for when langdetect is not available.
     Only supports basic language detection for common scripts.
+    When NumPy is installed all characters are classified in one
+    vectorized pass (a compiled loop when Numba is also installed).
     """
     
     # Character range definitions for common scripts
@@ -132,6 +384,16 @@ class SimpleNgramDetector:
         'Thai': (0x0E00, 0x0E7F),
     }
     
+    # Below this length the scalar table lookups beat NumPy's call overhead
+    NUMPY_MIN_LEN = 64
+    
+    _SCRIPT_NAMES = tuple(SCRIPT_RANGES)
+    _BOUNDARIES, _INTERVAL_IDS, _BMP_TABLE = _script_intervals(SCRIPT_RANGES)
+    if NUMPY_AVAILABLE:
+        _BOUNDARIES_NP = np.asarray(_BOUNDARIES, dtype=np.uint32)
+        _INTERVAL_IDS_NP = np.array(_INTERVAL_IDS, dtype=np.intp)
+        _BMP_TABLE_NP = np.frombuffer(_BMP_TABLE, dtype=np.uint8)
+    
     # Script to common language mapping
     SCRIPT_TO_LANGS = {
         'Latin': [('en', 0.3), ('es', 0.15), ('fr', 0.15), ('de', 0.1)],
@@ -161,27 +423,16 @@ class SimpleNgramDetector:
         if not text or not text.strip():
             return []
         
-        # Count characters per script
-        script_counts = Counter()
-        total_chars = 0
+        if NUMBA_AVAILABLE and len(text) >= self.NUMPY_MIN_LEN:
+            dominant_script = self._dominant_script_numba(text)
+        elif NUMPY_AVAILABLE and len(text) >= self.NUMPY_MIN_LEN:
+            dominant_script = self._dominant_script_numpy(text)
+        else:
+            dominant_script = self._dominant_script(text)
         
-        for char in text:
-            if char.isspace():
-                continue
-            
-            char_code = ord(char)
-            for script_name, (start, end) in self.SCRIPT_RANGES.items():
-                if start <= char_code <= end:
-                    script_counts[script_name] += 1
-                    total_chars += 1
-                    break
-        
-        if not script_counts:
+        if dominant_script is None:
             return [('unknown', 0.0)]
         
-        # Get dominant script
-        dominant_script = script_counts.most_common(1)[0][0]
-        
         # Return common languages for that script
         predictions = self.SCRIPT_TO_LANGS.get(
             dominant_script,
@@ -189,4 +440,86 @@ class SimpleNgramDetector:
         )
         
         return predictions[:k]
-
+    
+    def _dominant_script(self, text: str) -> Optional[str]:
+        """
+        Most frequent script among non-space characters (None if no match).
+        
+        BMP code points are classified with one index into the 64KB
+        _BMP_TABLE (whitespace and unmatched code points are _NO_SCRIPT);
+        astral code points fall back to a binary search over the interval
+        table. Ties go to the script seen first.
+        """
+        table = self._BMP_TABLE
+        boundaries = self._BOUNDARIES
+        interval_ids = self._INTERVAL_IDS
+        
+        # Count characters per script; a plain list indexed by script id
+        # avoids Counter's hashing on every increment
+        script_counts = [0] * len(self._SCRIPT_NAMES)
+        
+        for char_code in map(ord, text):
+            if char_code < 0x10000:
+                script_id = table[char_code]
+                if script_id != _NO_SCRIPT:
+                    script_counts[script_id] += 1
+            else:
+                script_id = interval_ids[bisect_right(boundaries, char_code) - 1]
+                if script_id >= 0:
+                    script_counts[script_id] += 1
+        
+        top = max(script_counts)
+        if not top:
+            return None
+        
+        if script_counts.count(top) == 1:
+            return self._SCRIPT_NAMES[script_counts.index(top)]
+        
+        # Tie: keep the script that appears first in the text
+        return self._SCRIPT_NAMES[next(
+            script_id for script_id in map(self._script_id, map(ord, text))
+            if script_id >= 0 and script_counts[script_id] == top
+        )]
+    
+    def _script_id(self, char_code: int) -> int:
+        """Script index of a code point, or -1 if it matches no script."""
+        if char_code < 0x10000:
+            script_id = self._BMP_TABLE[char_code]
+            return -1 if script_id == _NO_SCRIPT else script_id
+        return self._INTERVAL_IDS[bisect_right(self._BOUNDARIES, char_code) - 1]
+    
+    def _dominant_script_numpy(self, text: str) -> Optional[str]:
+        """
+        Vectorized _dominant_script: searchsorted over the interval table
+        classifies every code point at once, bincount tallies the scripts.
+        """
+        cps = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        ids = self._INTERVAL_IDS_NP[np.searchsorted(self._BOUNDARIES_NP, cps, side='right') - 1]
+        ids = ids[ids >= 0]
+        if not ids.size:
+            return None
+        
+        counts = np.bincount(ids, minlength=len(self._SCRIPT_NAMES))
+        best = np.flatnonzero(counts == counts.max())
+        if len(best) > 1:
+            # Tie: keep the script that appears first in the text
+            best = ids[np.isin(ids, best)]
+        return self._SCRIPT_NAMES[best[0]]
+    
+    def _dominant_script_numba(self, text: str) -> Optional[str]:
+        """
+        _dominant_script over a uint32 code point array with the
+        @njit-compiled _classify_scripts loop.
+        """
+        cps = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        counts, first_seen = _classify_scripts(
+            cps, self._BMP_TABLE_NP, self._BOUNDARIES_NP,
+            self._INTERVAL_IDS_NP, len(self._SCRIPT_NAMES)
+        )
+        top = counts.max()
+        if not top:
+            return None
+        
+        # Tie: keep the script that appears first in the text
+        best = np.flatnonzero(counts == top)
+        return self._SCRIPT_NAMES[best[np.argmin(first_seen[best])]]
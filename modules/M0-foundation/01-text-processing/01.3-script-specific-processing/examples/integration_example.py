@@ -8,46 +8,19 @@ and usage of script-specific processors.
 import sys
 from pathlib import Path
 
-# Add Task 01.2 to path for LanguageInfo import
-task_01_2_path = Path(__file__).parent.parent.parent / "01.2-language-detection"
-if task_01_2_path.exists():
-    sys.path.insert(0, str(task_01_2_path))
-    try:
-        from text_processing import LanguageInfo, detect_language
-        HAS_TASK_01_2 = True
-    except ImportError:
-        HAS_TASK_01_2 = False
-        # Fallback LanguageInfo
-        from dataclasses import dataclass
-        from typing import List, Tuple
-        
-        @dataclass
-        class LanguageInfo:
-            language_code: str
-            script_code: str
-            confidence: float
-            is_mixed_content: bool = False
-            detected_languages: List[Tuple[str, float]] = None
-            
-            def __post_init__(self):
-                if self.detected_languages is None:
-                    self.detected_languages = []
+# Make this task's packages importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Task 01.2 is loaded under its own name so it can't shadow this package
+from shared.language_detection import load_task_01_2
+
+_task_01_2 = load_task_01_2()
+HAS_TASK_01_2 = _task_01_2 is not None
+if HAS_TASK_01_2:
+    LanguageInfo = _task_01_2.LanguageInfo
+    detect_language = _task_01_2.detect_language
 else:
-    HAS_TASK_01_2 = False
-    from dataclasses import dataclass
-    from typing import List, Tuple
-    
-    @dataclass
-    class LanguageInfo:
-        language_code: str
-        script_code: str
-        confidence: float
-        is_mixed_content: bool = False
-        detected_languages: List[Tuple[str, float]] = None
-        
-        def __post_init__(self):
-            if self.detected_languages is None:
-                self.detected_languages = []
+    from shared.types import LanguageInfo
 
 # Import Task 01.3
 from text_processing import (
@@ -5,50 +5,214 @@ Interactive Testing Tool - Task 01.3
 Interactive CLI for testing script-specific processing.
 """
 
+import argparse
+import asyncio
+import multiprocessing
+import os
 import sys
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
-# Add Task 01.2 to path
-task_01_2_path = Path(__file__).parent.parent / "01.2-language-detection"
-if task_01_2_path.exists():
-    sys.path.insert(0, str(task_01_2_path))
-    try:
-        from text_processing import LanguageInfo, detect_language
-        HAS_TASK_01_2 = True
-    except ImportError:
-        HAS_TASK_01_2 = False
-        from dataclasses import dataclass
-        from typing import List, Tuple
-        
-        @dataclass
-        class LanguageInfo:
-            language_code: str
-            script_code: str
-            confidence: float
-            is_mixed_content: bool = False
-            detected_languages: List[Tuple[str, float]] = None
-            
-            def __post_init__(self):
-                if self.detected_languages is None:
-                    self.detected_languages = []
+try:
+    from prompt_toolkit import PromptSession
+    PROMPT_TOOLKIT_AVAILABLE = True
+except ImportError:
+    PROMPT_TOOLKIT_AVAILABLE = False
+
+# Task 01.2 is loaded under its own name so it can't shadow this package
+from shared.language_detection import load_task_01_2
+
+_task_01_2 = load_task_01_2()
+HAS_TASK_01_2 = _task_01_2 is not None
+if HAS_TASK_01_2:
+    LanguageInfo = _task_01_2.LanguageInfo
+    UniversalLanguageDetector = _task_01_2.UniversalLanguageDetector
+    detect_language = _task_01_2.detect_language
+    detect_language_batch = _task_01_2.detect_language_batch
 else:
-    HAS_TASK_01_2 = False
-    from dataclasses import dataclass
-    from typing import List, Tuple
-    
-    @dataclass
-    class LanguageInfo:
-        language_code: str
-        script_code: str
-        confidence: float
-        is_mixed_content: bool = False
-        detected_languages: List[Tuple[str, float]] = None
-        
-        def __post_init__(self):
-            if self.detected_languages is None:
-                self.detected_languages = []
+    from shared.types import LanguageInfo
+
+from text_processing import process_by_script
+from text_processing.cjk_processor import preload_jieba
+
+# --fast results below this confidence are re-detected in full
+FAST_MIN_CONFIDENCE = 0.5
+
+# Typing pause (seconds) before interactive input is detected in the background
+PREFETCH_DELAY = 0.15
+
+# Batches larger than this are script-processed in worker processes
+PARALLEL_MIN_TEXTS = 16
+
+# Scripts written by a single language: no model needed once the text is
+# (almost) entirely in one of them
+SCRIPT_GATE_MIN_FRACTION = 0.9
+SCRIPT_GATE_CONFIDENCE = 0.9
+
+_fast_detector = None
+
+
+def _fast_script_guess(text):
+    """
+    Guess LanguageInfo from the script alone, or None if ambiguous.
+    
+    Hangul is Korean and kana (with or without Han) is Japanese. Han alone
+    is not: kanji-only Japanese and Traditional Chinese are written in it,
+    so like Latin, Arabic and Cyrillic it always goes to the detector.
+    """
+    hangul = kana = han = letters = 0
+    for char in text:
+        if not char.isalpha():
+            continue
+        letters += 1
+        cp = ord(char)
+        if 0xAC00 <= cp <= 0xD7AF or 0x1100 <= cp <= 0x11FF or 0x3130 <= cp <= 0x318F:
+            hangul += 1
+        elif 0x3040 <= cp <= 0x30FF:
+            kana += 1
+        elif 0x4E00 <= cp <= 0x9FFF or 0x3400 <= cp <= 0x4DBF:
+            han += 1
+    
+    if not letters:
+        return None
+    
+    threshold = SCRIPT_GATE_MIN_FRACTION * letters
+    if hangul > threshold:
+        language_code, script_code = "ko", "Kore"
+    elif kana and kana + han > threshold:
+        language_code, script_code = "ja", "Jpan"
+    else:
+        return None
+    
+    return LanguageInfo(
+        language_code=language_code,
+        script_code=script_code,
+        confidence=SCRIPT_GATE_CONFIDENCE
+    )
+
+
+def _get_fast_detector():
+    """Top-1, quantized-model-only detector for --fast (built once)."""
+    global _fast_detector
+    if _fast_detector is None:
+        _fast_detector = UniversalLanguageDetector(top_k=1, low_memory=True)
+    return _fast_detector
+
+
+@lru_cache(maxsize=4096)
+def detect(text, fast=False):
+    """
+    Detect the language of one text, via the fast detector if requested.
+    
+    Memoized: re-entering the same sample text is a dict lookup.
+    """
+    language_info = _fast_script_guess(text)
+    if language_info is not None:
+        return language_info
+    
+    if fast:
+        language_info = _get_fast_detector().detect(text)
+        if language_info.confidence >= FAST_MIN_CONFIDENCE:
+            return language_info
+    return detect_language(text)
+
+
+def detect_batch(texts, fast=False):
+    """Detect the languages of texts, via the fast detector if requested."""
+    language_infos = [_fast_script_guess(text) for text in texts]
+    pending = [i for i, info in enumerate(language_infos) if info is None]
+    if not pending:
+        return language_infos
+    
+    if fast:
+        detected = _get_fast_detector().detect_batch([texts[i] for i in pending])
+    else:
+        detected = detect_language_batch([texts[i] for i in pending])
+    for i, info in zip(pending, detected):
+        language_infos[i] = info
+    
+    uncertain = [
+        i for i in pending
+        if fast and language_infos[i].confidence < FAST_MIN_CONFIDENCE
+    ]
+    if uncertain:
+        redetected = detect_language_batch([texts[i] for i in uncertain])
+        for i, info in zip(uncertain, redetected):
+            language_infos[i] = info
+    return language_infos
+
+
+@lru_cache(maxsize=4096)
+def _process_cached(text, language_code, script_code, confidence):
+    """Script-process text for one language/script (memoized)."""
+    return process_by_script(
+        text,
+        LanguageInfo(
+            language_code=language_code,
+            script_code=script_code,
+            confidence=confidence
+        )
+    )
+
+
+def process(text, language_info):
+    """Script-process text, reusing results for repeated (text, language, script)."""
+    return _process_cached(
+        text,
+        language_info.language_code,
+        language_info.script_code,
+        language_info.confidence
+    )
 
-from text_processing import ScriptHandler, process_by_script
+
+def _init_worker():
+    """Load the jieba dictionary once per worker process."""
+    preload_jieba()
+
+
+def _process_one(item):
+    """
+    Script-process one (text, language, script, confidence) item.
+    
+    Returns:
+        (ProcessedText, None) on success, (None, error message) on failure
+    """
+    try:
+        return _process_cached(*item), None
+    except Exception as e:
+        return None, str(e)
+
+
+def process_all(texts, language_infos):
+    """
+    Script-process texts in order, in worker processes for large batches.
+    
+    jieba segmentation is pure Python and holds the GIL, so threads would
+    not help; each worker process loads its own dictionary once.
+    """
+    items = [
+        (text, info.language_code, info.script_code, info.confidence)
+        for text, info in zip(texts, language_infos)
+    ]
+    if len(items) <= PARALLEL_MIN_TEXTS:
+        return [_process_one(item) for item in items]
+    
+    workers = os.cpu_count() or 1
+    # fork reuses the parent's imports instead of re-running this script
+    context = (
+        multiprocessing.get_context('fork')
+        if 'fork' in multiprocessing.get_all_start_methods() else None
+    )
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker
+    ) as pool:
+        return list(pool.map(
+            _process_one,
+            items,
+            chunksize=max(1, len(items) // (workers * 4))
+        ))
 
 
 def print_result(result):
@@ -67,10 +231,123 @@ def print_result(result):
     print("=" * 60 + "\n")
 
 
-def interactive_mode():
-    """Interactive mode for testing."""
-    handler = ScriptHandler()
+def _handle_line(text, fast=False):
+    """
+    Detect and process one line of interactive input.
+    
+    Returns:
+        False if the user asked to quit, True otherwise
+    """
+    if text.lower() in ('quit', 'exit', 'q'):
+        print("Goodbye!")
+        return False
     
+    if not text:
+        return True
+    
+    # Try to detect language if Task 01.2 available
+    if HAS_TASK_01_2:
+        try:
+            language_info = detect(text, fast=fast)
+            print(f"\nDetected: {language_info.language_code} ({language_info.script_code})")
+        except Exception as e:
+            print(f"\nLanguage detection failed: {e}")
+            print("Using default language info...")
+            language_info = LanguageInfo(
+                language_code="en",
+                script_code="Latn",
+                confidence=0.5
+            )
+    else:
+        # Manual language selection
+        print("\nSelect language:")
+        print("1. Persian (fa)")
+        print("2. Arabic (ar)")
+        print("3. Chinese (zh)")
+        print("4. Japanese (ja)")
+        print("5. Korean (ko)")
+        print("6. Russian (ru)")
+        print("7. English (en)")
+        print("8. French (fr)")
+        
+        choice = input("Choice (1-8, default 7): ").strip() or "7"
+        
+        lang_map = {
+            "1": ("fa", "Arab"),
+            "2": ("ar", "Arab"),
+            "3": ("zh", "Hans"),
+            "4": ("ja", "Jpan"),
+            "5": ("ko", "Kore"),
+            "6": ("ru", "Cyrl"),
+            "7": ("en", "Latn"),
+            "8": ("fr", "Latn"),
+        }
+        
+        lang_code, script_code = lang_map.get(choice, ("en", "Latn"))
+        language_info = LanguageInfo(
+            language_code=lang_code,
+            script_code=script_code,
+            confidence=0.95
+        )
+    
+    # Process text
+    try:
+        result = process(text, language_info)
+        print_result(result)
+    except Exception as e:
+        print(f"\nError processing text: {e}")
+        import traceback
+        traceback.print_exc()
+        print()
+    
+    return True
+
+
+async def _prefetch_detection(text, fast):
+    """Detect text in a worker thread after a short typing pause."""
+    await asyncio.sleep(PREFETCH_DELAY)
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, detect, text, fast)
+    except Exception:
+        pass  # Reported when the line is submitted
+
+
+async def _interactive_loop_async(fast):
+    """
+    Read lines with prompt_toolkit, detecting the language while typing.
+    
+    Every edit restarts a debounced background detect() of the current
+    buffer; detect() is memoized, so by the time Enter is pressed the
+    result is usually cached.
+    """
+    session = PromptSession()
+    prefetch = None
+    
+    def on_text_changed(buffer):
+        nonlocal prefetch
+        if prefetch is not None:
+            prefetch.cancel()
+        text = buffer.text.strip()
+        prefetch = asyncio.ensure_future(_prefetch_detection(text, fast)) if text else None
+    
+    if HAS_TASK_01_2:
+        session.default_buffer.on_text_changed += on_text_changed
+    
+    while True:
+        try:
+            text = (await session.prompt_async("Enter text: ")).strip()
+        except (KeyboardInterrupt, EOFError):
+            print("\n\nGoodbye!")
+            break
+        if prefetch is not None:
+            prefetch.cancel()
+            prefetch = None
+        if not _handle_line(text, fast):
+            break
+
+
+def interactive_mode(fast=False):
+    """Interactive mode for testing."""
     print("\n" + "=" * 60)
     print("Script-Specific Processing - Interactive Test")
     print("=" * 60)
@@ -83,118 +360,72 @@ def interactive_mode():
     print("  - Mixed:   Hello سلام")
     print("=" * 60 + "\n")
     
+    if PROMPT_TOOLKIT_AVAILABLE and sys.stdin.isatty():
+        asyncio.run(_interactive_loop_async(fast))
+        return
+    
     while True:
         try:
             text = input("Enter text: ").strip()
-            
-            if text.lower() in ('quit', 'exit', 'q'):
-                print("Goodbye!")
-                break
-            
-            if not text:
-                continue
-            
-            # Try to detect language if Task 01.2 available
-            if HAS_TASK_01_2:
-                try:
-                    language_info = detect_language(text)
-                    print(f"\nDetected: {language_info.language_code} ({language_info.script_code})")
-                except Exception as e:
-                    print(f"\nLanguage detection failed: {e}")
-                    print("Using default language info...")
-                    language_info = LanguageInfo(
-                        language_code="en",
-                        script_code="Latn",
-                        confidence=0.5
-                    )
-            else:
-                # Manual language selection
-                print("\nSelect language:")
-                print("1. Persian (fa)")
-                print("2. Arabic (ar)")
-                print("3. Chinese (zh)")
-                print("4. Japanese (ja)")
-                print("5. Korean (ko)")
-                print("6. Russian (ru)")
-                print("7. English (en)")
-                print("8. French (fr)")
-                
-                choice = input("Choice (1-8, default 7): ").strip() or "7"
-                
-                lang_map = {
-                    "1": ("fa", "Arab"),
-                    "2": ("ar", "Arab"),
-                    "3": ("zh", "Hans"),
-                    "4": ("ja", "Jpan"),
-                    "5": ("ko", "Kore"),
-                    "6": ("ru", "Cyrl"),
-                    "7": ("en", "Latn"),
-                    "8": ("fr", "Latn"),
-                }
-                
-                lang_code, script_code = lang_map.get(choice, ("en", "Latn"))
-                language_info = LanguageInfo(
-                    language_code=lang_code,
-                    script_code=script_code,
-                    confidence=0.95
-                )
-            
-            # Process text
-            try:
-                result = handler.process_by_script(text, language_info)
-                print_result(result)
-            except Exception as e:
-                print(f"\nError processing text: {e}")
-                import traceback
-                traceback.print_exc()
-                print()
-        
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\n\nGoodbye!")
             break
-        except EOFError:
-            print("\n\nGoodbye!")
+        if not _handle_line(text, fast):
             break
 
 
-def batch_mode(texts):
+def batch_mode(texts, fast=False):
     """Batch mode for processing multiple texts."""
-    handler = ScriptHandler()
-    
     print("\n" + "=" * 60)
     print("Batch Processing")
     print("=" * 60 + "\n")
     
-    for i, text in enumerate(texts, 1):
-        print(f"Text {i}: {text}")
-        
-        # Detect language if available
-        if HAS_TASK_01_2:
-            try:
-                language_info = detect_language(text)
-            except Exception:
-                language_info = LanguageInfo("en", "Latn", 0.5)
-        else:
-            language_info = LanguageInfo("en", "Latn", 0.5)
-        
-        # Process
+    # Detect all languages in one call (one detector, one batch pass)
+    language_infos = None
+    if HAS_TASK_01_2:
         try:
-            result = handler.process_by_script(text, language_info)
-            print(f"  → {result.text} ({result.script_code})")
-        except Exception as e:
-            print(f"  → Error: {e}")
-        print()
+            language_infos = detect_batch(texts, fast=fast)
+        except Exception:
+            language_infos = None
+    if language_infos is None:
+        language_infos = [LanguageInfo("en", "Latn", 0.5) for _ in texts]
+    
+    outcomes = process_all(texts, language_infos)
+    
+    # Collect the report and write it once instead of printing per line
+    out = []
+    for i, (text, (result, error)) in enumerate(zip(texts, outcomes), 1):
+        out.append(f"Text {i}: {text}\n")
+        if error is None:
+            out.append(f"  → {result.text} ({result.script_code})\n\n")
+        else:
+            out.append(f"  → Error: {error}\n\n")
+    
+    sys.stdout.write(''.join(out))
+    sys.stdout.flush()
 
 
 def main():
     """Main entry point."""
-    if len(sys.argv) > 1:
+    parser = argparse.ArgumentParser(description="Test script-specific processing")
+    parser.add_argument("texts", nargs="*", help="Texts to process (interactive mode if none)")
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Faster top-1 detection; low-confidence texts are re-detected in full"
+    )
+    args = parser.parse_args()
+    
+    # The shared handler loads jieba lazily; both modes expect CJK input,
+    # so pay for the dictionary before the first text instead
+    preload_jieba()
+    
+    if args.texts:
         # Batch mode
-        texts = sys.argv[1:]
-        batch_mode(texts)
+        batch_mode(args.texts, fast=args.fast)
     else:
         # Interactive mode
-        interactive_mode()
+        interactive_mode(fast=args.fast)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,64 @@
+"""Access to Task 01.2 (language detection) without sys.path changes."""
+
+import importlib
+import importlib.abc
+import importlib.util
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+TASK_01_2_DIR = Path(__file__).resolve().parent.parent.parent / "01.2-language-detection"
+
+# Task 01.2's package is registered under this name instead of its own
+_MODULE_NAME = "language_detection"
+
+
+class Task012Finder(importlib.abc.MetaPathFinder):
+    """
+    Resolve "language_detection" to Task 01.2's text_processing package.
+
+    Both tasks name their package text_processing, so putting Task 01.2 on
+    sys.path would shadow this one (or the other way round). This finder
+    maps the distinct name straight to Task 01.2's __init__.py, so
+    "text_processing" keeps resolving to this task through sys.path while
+    Task 01.2 is importable side by side. Its submodules are found through
+    the package's __path__ as usual.
+    """
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname != _MODULE_NAME:
+            return None
+        init_file = TASK_01_2_DIR / "text_processing" / "__init__.py"
+        if not init_file.exists():
+            return None
+        return importlib.util.spec_from_file_location(
+            _MODULE_NAME,
+            init_file,
+            submodule_search_locations=[str(init_file.parent)]
+        )
+
+
+def install_finder() -> None:
+    """Put Task012Finder first on sys.meta_path (once)."""
+    if not any(isinstance(finder, Task012Finder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, Task012Finder())
+
+
+install_finder()
+
+
+@lru_cache(maxsize=None)
+def load_task_01_2():
+    """
+    Import Task 01.2's text_processing package once, as "language_detection".
+
+    Returns:
+        Task 01.2's package module (LanguageInfo, detect_language, ...), or
+        None if Task 01.2 is missing or cannot be imported
+    """
+    try:
+        return importlib.import_module(_MODULE_NAME)
+    except ImportError:
+        for name in [n for n in sys.modules if n == _MODULE_NAME or n.startswith(_MODULE_NAME + ".")]:
+            del sys.modules[name]
+        return None
@@ -6,6 +6,12 @@ from typing import Optional
 
 import structlog
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def setup_logger(
     name: str,
@@ -32,25 +38,36 @@ def setup_logger(
         level=log_level,
     )
     
-    # Configure structlog
+    # Configure structlog. Records below log_level never reach these
+    # processors: the filtering bound logger turns those methods into no-ops.
     processors = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
-        structlog.processors.StackInfoRenderer(),
-        structlog.dev.set_exc_info,
-        structlog.processors.TimeStamper(fmt="iso"),
     ]
+    if log_level <= logging.DEBUG:
+        # stack_info / implicit exc_info support, only worth it when debugging
+        processors += [
+            structlog.processors.StackInfoRenderer(),
+            structlog.dev.set_exc_info,
+        ]
+    processors.append(structlog.processors.TimeStamper(fmt="iso"))
     
-    if json_format:
+    if json_format and ORJSON_AVAILABLE:
+        # orjson renders straight to bytes; BytesLogger writes them as-is
+        processors.append(structlog.processors.JSONRenderer(serializer=orjson.dumps))
+        logger_factory = structlog.BytesLoggerFactory()
+    elif json_format:
         processors.append(structlog.processors.JSONRenderer())
+        logger_factory = structlog.PrintLoggerFactory()
     else:
         processors.append(structlog.dev.ConsoleRenderer())
+        logger_factory = structlog.PrintLoggerFactory()
     
     structlog.configure(
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
     
@@ -0,0 +1,30 @@
+"""Shared types for script-specific processing."""
+
+import sys
+from dataclasses import dataclass
+from typing import Tuple
+
+# dataclass(slots=True) needs Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class LanguageInfo:
+    """
+    Minimal LanguageInfo, used when Task 01.2 is not importable.
+    
+    Mirrors the fields of Task 01.2's LanguageInfo that script processing
+    reads. Immutable and hashable, so it can be used as a cache key.
+    
+    Attributes:
+        language_code: ISO 639-1 language code (e.g., "fa", "en", "zh")
+        script_code: ISO 15924 script code (e.g., "Arab", "Latn", "Hans")
+        confidence: Detection confidence (0.0-1.0)
+        is_mixed_content: Whether multiple languages were detected
+        detected_languages: (language_code, probability) pairs, best first
+    """
+    language_code: str
+    script_code: str
+    confidence: float
+    is_mixed_content: bool = False
+    detected_languages: Tuple[Tuple[str, float], ...] = ()
@@ -3,178 +3,91 @@
 import sys
 from pathlib import Path
 
-# Ensure we import from the correct text_processing module (this one, not 01.2)
-# Remove any conflicting paths that might point to 01.2-language-detection
-conflicting_paths = [p for p in sys.path if '01.2-language-detection' in str(p)]
-for path in conflicting_paths:
-    sys.path.remove(path)
-
-# Add the parent directory to sys.path so imports work correctly
-module_dir = Path(__file__).parent.parent
-if str(module_dir) not in sys.path:
-    sys.path.insert(0, str(module_dir))
-
-# Clear import cache to ensure fresh imports
-import importlib
-importlib.invalidate_caches()
+# This task's packages; Task 01.2 is never put on sys.path (it is loaded
+# from its file under another name, see shared.language_detection)
+module_dir = str(Path(__file__).parent.parent)
+if module_dir not in sys.path:
+    sys.path.insert(0, module_dir)
 
 import pytest
-from dataclasses import dataclass
-from typing import List, Tuple
-
-
-def pytest_configure(config):
-    """Configure pytest to use the correct module path."""
-    # This runs before test collection, ensuring correct imports
-    import sys
-    from pathlib import Path
-    
-    # Remove conflicting paths
-    conflicting_paths = [p for p in sys.path if '01.2-language-detection' in str(p)]
-    for path in conflicting_paths:
-        if path in sys.path:
-            sys.path.remove(path)
-    
-    # Ensure our module directory is first
-    module_dir = Path(__file__).parent.parent
-    module_dir_str = str(module_dir)
-    if module_dir_str in sys.path:
-        sys.path.remove(module_dir_str)
-    sys.path.insert(0, module_dir_str)
-    
-    # Clear import cache
-    importlib.invalidate_caches()
-
-
-@dataclass
-class LanguageInfo:
-    """Minimal LanguageInfo for testing."""
-    language_code: str
-    script_code: str
-    confidence: float
-    is_mixed_content: bool = False
-    detected_languages: List[Tuple[str, float]] = None
-    
-    def __post_init__(self):
-        if self.detected_languages is None:
-            self.detected_languages = []
 
+from shared.types import LanguageInfo
 
-@pytest.fixture
-def language_info_fa():
-    """Persian language info."""
-    return LanguageInfo(
-        language_code="fa",
-        script_code="Arab",
-        confidence=0.98
-    )
 
+@pytest.fixture(scope="session", autouse=True)
+def _warm_jieba():
+    """Load the jieba dictionary once, before the first test needs it."""
+    from text_processing.cjk_processor import preload_jieba
+    preload_jieba()  # False (CJK tests skip) if jieba is not installed
 
-@pytest.fixture
-def language_info_ar():
-    """Arabic language info."""
-    return LanguageInfo(
-        language_code="ar",
-        script_code="Arab",
-        confidence=0.95
-    )
 
+@pytest.fixture(scope="session")
+def handler():
+    """ScriptHandler shared by the whole test session (stateless)."""
+    from text_processing import ScriptHandler
+    return ScriptHandler()
 
-@pytest.fixture
-def language_info_zh():
-    """Chinese language info."""
-    return LanguageInfo(
-        language_code="zh",
-        script_code="Hans",
-        confidence=0.99
-    )
-
-
-@pytest.fixture
-def language_info_ja():
-    """Japanese language info."""
-    return LanguageInfo(
-        language_code="ja",
-        script_code="Jpan",
-        confidence=0.97
-    )
-
-
-@pytest.fixture
-def language_info_ko():
-    """Korean language info."""
-    return LanguageInfo(
-        language_code="ko",
-        script_code="Kore",
-        confidence=0.96
-    )
 
-
-@pytest.fixture
-def language_info_ru():
-    """Russian language info."""
-    return LanguageInfo(
-        language_code="ru",
-        script_code="Cyrl",
-        confidence=0.98
-    )
-
-
-@pytest.fixture
-def language_info_en():
-    """English language info."""
-    return LanguageInfo(
-        language_code="en",
-        script_code="Latn",
-        confidence=0.99
-    )
-
-
-@pytest.fixture
-def language_info_fr():
-    """French language info."""
-    return LanguageInfo(
-        language_code="fr",
-        script_code="Latn",
-        confidence=0.97
-    )
+@pytest.fixture(scope="session")
+def task_01_2():
+    """
+    Task 01.2's package, imported by the first test that asks for it.
+    
+    Tests using it are skipped when Task 01.2 is not importable.
+    """
+    from shared.language_detection import load_task_01_2
+    module = load_task_01_2()
+    if module is None:
+        pytest.skip("Task 01.2 not available")
+    return module
 
 
-@pytest.fixture
-def language_info_ur():
-    """Urdu language info."""
-    return LanguageInfo(
-        language_code="ur",
-        script_code="Arab",
-        confidence=0.97
-    )
+@pytest.fixture(scope="session")
+def detect_language(task_01_2):
+    """detect() of one Task 01.2 detector shared by the session."""
+    # task_01_2.detect_language would build (and log) a new detector with
+    # an empty cache on every call
+    return task_01_2.UniversalLanguageDetector().detect
 
 
 @pytest.fixture
-def language_info_de():
-    """German language info."""
+def fresh_handler():
+    """New ScriptHandler per test, for tests that construct or mutate one."""
+    from text_processing import ScriptHandler
+    return ScriptHandler()
+
+
+# language code -> (script code, confidence, name)
+LANGUAGE_INFOS = {
+    "fa": ("Arab", 0.98, "Persian"),
+    "ar": ("Arab", 0.95, "Arabic"),
+    "zh": ("Hans", 0.99, "Chinese"),
+    "ja": ("Jpan", 0.97, "Japanese"),
+    "ko": ("Kore", 0.96, "Korean"),
+    "ru": ("Cyrl", 0.98, "Russian"),
+    "en": ("Latn", 0.99, "English"),
+    "fr": ("Latn", 0.97, "French"),
+    "ur": ("Arab", 0.97, "Urdu"),
+    "de": ("Latn", 0.98, "German"),
+    "es": ("Latn", 0.98, "Spanish"),
+    "pl": ("Latn", 0.97, "Polish"),
+}
+
+
+def _make_language_info(language_code: str) -> LanguageInfo:
+    script_code, confidence, _ = LANGUAGE_INFOS[language_code]
     return LanguageInfo(
-        language_code="de",
-        script_code="Latn",
-        confidence=0.98
+        language_code=language_code,
+        script_code=script_code,
+        confidence=confidence
     )
 
 
-@pytest.fixture
-def language_info_es():
-    """Spanish language info."""
-    return LanguageInfo(
-        language_code="es",
-        script_code="Latn",
-        confidence=0.98
-    )
-
-
-@pytest.fixture
-def language_info_pl():
-    """Polish language info."""
-    return LanguageInfo(
-        language_code="pl",
-        script_code="Latn",
-        confidence=0.97
-    )
+# LanguageInfo is frozen, so one instance per language serves the session.
+# Tests pick languages with
+#   @pytest.mark.parametrize("language_info", ["fa"], indirect=True)
+# and run for every language in LANGUAGE_INFOS otherwise.
+@pytest.fixture(scope="session", params=list(LANGUAGE_INFOS))
+def language_info(request):
+    """Language info for a language code from LANGUAGE_INFOS."""
+    return _make_language_info(request.param)
@@ -11,25 +11,6 @@ Tests cover:
 - Performance requirements
 """
 
-import sys
-from pathlib import Path
-
-# Fix import path - ensure we import from this module, not 01.2-language-detection
-module_dir = Path(__file__).parent.parent
-module_dir_str = str(module_dir)
-# Remove conflicting paths
-conflicting_paths = [p for p in sys.path if '01.2-language-detection' in str(p)]
-for path in conflicting_paths:
-    if path in sys.path:
-        sys.path.remove(path)
-# Ensure our module is first
-if module_dir_str in sys.path:
-    sys.path.remove(module_dir_str)
-sys.path.insert(0, module_dir_str)
-# Clear import cache
-import importlib
-importlib.invalidate_caches()
-
 import pytest
 from text_processing import (
     ScriptHandler,
@@ -40,6 +21,7 @@ from text_processing import (
 from text_processing.arabic_processor import (
     preserve_zwnj,
     remove_arabic_diacritics,
+    ARABIC_DIACRITICS,
     normalize_arabic_shapes,
     process_arabic,
     ZWNJ,
@@ -61,14 +43,18 @@ from text_processing.latin_processor import (
 )
 from text_processing.script_handler import detect_script_boundaries
 
-# Import LanguageInfo - use the one from conftest via pytest's import mechanism
-# Since conftest is in the same directory, we can import it directly
-import importlib.util
-conftest_path = Path(__file__).parent / "conftest.py"
-spec = importlib.util.spec_from_file_location("conftest", conftest_path)
-conftest_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(conftest_module)
-LanguageInfo = conftest_module.LanguageInfo
+from shared.types import LanguageInfo
+
+# Sample texts shared by the tests below
+SAMPLES = {
+    "fa": "می‌خواهم",
+    "zh": "你好世界",
+    "ru": "Привет мир",
+    "en": "Hello World",
+    "ja": "こんにちは世界",
+    "ko": "안녕하세요 세계",
+    "mixed_ar": "Hello سلام",
+}
 
 
 # ============================================================================
@@ -78,9 +64,9 @@ LanguageInfo = conftest_module.LanguageInfo
 class TestArabicProcessor:
     """Test Arabic script processing."""
     
-    def test_zwnj_preservation(self, language_info_fa):
+    def test_zwnj_preservation(self):
         """Test ZWNJ preservation in Persian text."""
-        text = "می‌خواهم"  # Contains ZWNJ
+        text = SAMPLES["fa"]  # Contains ZWNJ
         result = process_arabic(text, "fa")
         
         assert ZWNJ in result.text, "ZWNJ must be preserved"
@@ -89,7 +75,7 @@ class TestArabicProcessor:
     
     def test_zwnj_preservation_function(self):
         """Test ZWNJ preservation function."""
-        text = "می‌خواهم"
+        text = SAMPLES["fa"]
         preserved = preserve_zwnj(text)
         assert preserved == text
         assert ZWNJ in preserved
@@ -107,6 +93,13 @@ class TestArabicProcessor:
         assert "مرحبا" in result or len(result) < len(text)
         assert "remove_diacritics" not in result  # No diacritics in result
     
+    def test_remove_arabic_diacritics_keeps_zwnj(self):
+        """Diacritic removal drops every tashkeel mark and nothing else."""
+        text = "مَرْحَبًا می‌خواهم"
+        result = remove_arabic_diacritics(text)
+        assert result == "مرحبا می‌خواهم"
+        assert not ARABIC_DIACRITICS.intersection(result)
+    
     def test_preserve_diacritics(self):
         """Test preserving Arabic diacritics."""
         text = "مَرْحَبًا"
@@ -120,9 +113,16 @@ class TestArabicProcessor:
         assert isinstance(result, str)
         assert len(result) == len(text)
     
-    def test_arabic_processing_persian(self, language_info_fa):
+    def test_normalize_arabic_presentation_forms(self):
+        """Test presentation forms fold to base letters, keeping length."""
+        text = "\uFEB3\uFEE0\uFE8E\uFEE1"  # سلام as initial/medial/final forms
+        assert normalize_arabic_shapes(text) == "سلام"
+        # Ligatures (lam-alef) would change the length, so they are kept
+        assert normalize_arabic_shapes("\uFEFB") == "\uFEFB"
+    
+    def test_arabic_processing_persian(self):
         """Test full Arabic processing for Persian."""
-        text = "می‌خواهم"
+        text = SAMPLES["fa"]
         result = process_arabic(text, "fa")
         
         assert result.script_code == "Arab"
@@ -130,7 +130,7 @@ class TestArabicProcessor:
         assert result.original == text
         assert "preserve_zwnj" in result.applied_rules
     
-    def test_arabic_processing_arabic(self, language_info_ar):
+    def test_arabic_processing_arabic(self):
         """Test full Arabic processing for Arabic."""
         text = "مرحبا"
         result = process_arabic(text, "ar")
@@ -139,7 +139,7 @@ class TestArabicProcessor:
         assert result.language_code == "ar"
         assert result.original == text
     
-    def test_arabic_processing_urdu(self, language_info_ur):
+    def test_arabic_processing_urdu(self):
         """Test full Arabic processing for Urdu."""
         text = "آپ کیسے ہیں"  # "How are you" in Urdu
         result = process_arabic(text, "ur")
@@ -149,7 +149,7 @@ class TestArabicProcessor:
         assert result.original == text
         assert "preserve_zwnj" in result.applied_rules
     
-    def test_arabic_processing_urdu_zwnj(self, language_info_ur):
+    def test_arabic_processing_urdu_zwnj(self):
         """Test Urdu text with ZWNJ preservation."""
         # Urdu also uses ZWNJ like Persian
         text = "میں"  # "I" in Urdu (may contain ZWNJ)
@@ -180,9 +180,9 @@ class TestCJKProcessor:
     """Test CJK script processing."""
     
     @pytest.mark.requires_jieba
-    def test_chinese_segmentation(self, language_info_zh):
+    def test_chinese_segmentation(self):
         """Test Chinese word segmentation."""
-        text = "你好世界"
+        text = SAMPLES["zh"]
         result = process_cjk(text, "zh", "Hans")
         
         assert result.script_code == "Hans"
@@ -193,14 +193,46 @@ class TestCJKProcessor:
     @pytest.mark.requires_jieba
     def test_segment_chinese_function(self):
         """Test Chinese segmentation function."""
-        text = "你好世界"
+        text = SAMPLES["zh"]
         words = segment_chinese(text)
         assert isinstance(words, list)
         assert len(words) > 0
     
-    def test_japanese_tokenization(self, language_info_ja):
+    @pytest.mark.requires_jieba
+    def test_segment_chinese_search_mode(self):
+        """Test search mode adds the sub-words of long compounds."""
+        words = segment_chinese("中国科学院", search_mode=True)
+        assert "中国" in words
+        assert "中国科学院" in words
+    
+    def test_jieba_dictionary_override(self, monkeypatch, tmp_path):
+        """Test JIEBA_DICTIONARY selects a custom jieba dictionary."""
+        from text_processing import cjk_processor
+        
+        monkeypatch.delenv("JIEBA_DICTIONARY", raising=False)
+        monkeypatch.setattr(cjk_processor, "BIG_DICTIONARY_PATH", tmp_path / "missing.txt")
+        assert cjk_processor._jieba_dictionary() is None
+        
+        custom = tmp_path / "dict.txt.big"
+        monkeypatch.setenv("JIEBA_DICTIONARY", str(custom))
+        assert cjk_processor._jieba_dictionary() == custom
+    
+    @pytest.mark.requires_jieba
+    def test_jieba_loaded_once(self):
+        """Test every handler shares one preloaded jieba tokenizer."""
+        from text_processing import cjk_processor
+        
+        ScriptHandler()
+        tokenizer = cjk_processor._jieba
+        assert tokenizer is not None
+        
+        ScriptHandler()
+        segment_chinese(SAMPLES["zh"])
+        assert cjk_processor._jieba is tokenizer
+    
+    def test_japanese_tokenization(self):
         """Test Japanese tokenization."""
-        text = "こんにちは世界"
+        text = SAMPLES["ja"]
         result = process_cjk(text, "ja", "Jpan")
         
         assert result.script_code == "Jpan"
@@ -214,9 +246,9 @@ class TestCJKProcessor:
         assert isinstance(words, list)
         assert len(words) > 0
     
-    def test_korean_segmentation(self, language_info_ko):
+    def test_korean_segmentation(self):
         """Test Korean word segmentation."""
-        text = "안녕하세요 세계"
+        text = SAMPLES["ko"]
         result = process_cjk(text, "ko", "Kore")
         
         assert result.script_code == "Kore"
@@ -244,6 +276,14 @@ class TestCJKProcessor:
         boundaries = get_word_boundaries(text, words)
         assert isinstance(boundaries, list)
         assert 0 in boundaries
+    
+    def test_cjk_word_boundaries_offsets(self):
+        """Test boundaries are sorted, unique end offsets of each word."""
+        from text_processing.cjk_processor import get_word_boundaries
+        
+        assert get_word_boundaries("你好 世界", ["你好", "", "世界"]) == [0, 2, 5]
+        # Missing words advance the cursor by their length
+        assert get_word_boundaries("你好世界", ["你好", "xx"]) == [0, 2, 4]
 
 
 # ============================================================================
@@ -259,28 +299,32 @@ class TestCyrillicProcessor:
         result = unify_cyrillic_variants(text, normalize_yo=True)
         assert "ё" not in result or "е" in result
     
+    def test_unify_cyrillic_variants_uppercase(self):
+        """Test Ё → Е is unified along with ё → е."""
+        assert unify_cyrillic_variants("Ёлка и ёж", normalize_yo=True) == "Елка и еж"
+    
     def test_preserve_yo(self):
         """Test preserving ё character."""
         text = "ёлка"
         result = unify_cyrillic_variants(text, normalize_yo=False, language_code="ru")
         assert "ё" in result
     
-    def test_cyrillic_processing(self, language_info_ru):
+    def test_cyrillic_processing(self):
         """Test full Cyrillic processing."""
-        text = "Привет мир"
+        text = SAMPLES["ru"]
         result = process_cyrillic(text, "ru")
         
         assert result.script_code == "Cyrl"
         assert result.language_code == "ru"
         assert result.original == text
     
-    def test_cyrillic_normalize_yo(self, language_info_ru):
+    def test_cyrillic_normalize_yo(self):
         """Test Cyrillic with yo normalization."""
         text = "ёлка"
         result = process_cyrillic(text, "ru", normalize_yo=True)
         assert "unify_variants" in result.applied_rules
     
-    def test_cyrillic_preserve_yo(self, language_info_ru):
+    def test_cyrillic_preserve_yo(self):
         """Test Cyrillic preserving yo."""
         text = "ёлка"
         result = process_cyrillic(text, "ru", normalize_yo=False)
@@ -306,6 +350,10 @@ class TestLatinProcessor:
         result = normalize_diacritics(text)
         assert "é" not in result or "e" in result
     
+    def test_normalize_diacritics_strips_marks_only(self):
+        """Combining marks go; precomposed letters without marks stay."""
+        assert normalize_diacritics("Ça ñ ẫ e\u0301 ø") == "Ca n a e ø"
+    
     def test_preserve_diacritics_for_language(self):
         """Test preserving diacritics for specific languages."""
         text = "café"
@@ -324,16 +372,16 @@ class TestLatinProcessor:
         result = handle_ligatures(text, preserve_semantic=False)
         assert "ae" in result or "æ" not in result
     
-    def test_latin_processing_english(self, language_info_en):
+    def test_latin_processing_english(self):
         """Test Latin processing for English."""
-        text = "Hello World"
+        text = SAMPLES["en"]
         result = process_latin(text, "en")
         
         assert result.script_code == "Latn"
         assert result.language_code == "en"
         assert result.original == text
     
-    def test_latin_processing_french(self, language_info_fr):
+    def test_latin_processing_french(self):
         """Test Latin processing for French (preserves diacritics)."""
         text = "café"
         result = process_latin(text, "fr", normalize_diacritics_flag=False)
@@ -343,7 +391,7 @@ class TestLatinProcessor:
         assert "é" in result.text  # Diacritic preserved
         assert "preserve_diacritics" in result.applied_rules
     
-    def test_latin_processing_german(self, language_info_de):
+    def test_latin_processing_german(self):
         """Test Latin processing for German (preserves diacritics: ä, ö, ü, ß)."""
         text = "Müller"  # Contains ü
         result = process_latin(text, "de", normalize_diacritics_flag=False)
@@ -353,7 +401,7 @@ class TestLatinProcessor:
         assert "ü" in result.text  # Diacritic preserved
         assert "preserve_diacritics" in result.applied_rules
     
-    def test_latin_processing_german_eszett(self, language_info_de):
+    def test_latin_processing_german_eszett(self):
         """Test German ß (Eszett) character preservation."""
         text = "Straße"  # Contains ß
         result = process_latin(text, "de", normalize_diacritics_flag=False)
@@ -363,7 +411,7 @@ class TestLatinProcessor:
         assert "ß" in result.text  # ß preserved
         assert "preserve_diacritics" in result.applied_rules
     
-    def test_latin_processing_spanish(self, language_info_es):
+    def test_latin_processing_spanish(self):
         """Test Latin processing for Spanish (preserves diacritics: ñ, á, é, etc.)."""
         text = "España"  # Contains ñ
         result = process_latin(text, "es", normalize_diacritics_flag=False)
@@ -373,7 +421,7 @@ class TestLatinProcessor:
         assert "ñ" in result.text  # Diacritic preserved
         assert "preserve_diacritics" in result.applied_rules
     
-    def test_latin_processing_spanish_accents(self, language_info_es):
+    def test_latin_processing_spanish_accents(self):
         """Test Spanish accented vowels preservation."""
         text = "José María"  # Contains é and í
         result = process_latin(text, "es", normalize_diacritics_flag=False)
@@ -383,7 +431,7 @@ class TestLatinProcessor:
         assert "é" in result.text and "í" in result.text
         assert "preserve_diacritics" in result.applied_rules
     
-    def test_latin_processing_polish(self, language_info_pl):
+    def test_latin_processing_polish(self):
         """Test Latin processing for Polish (preserves diacritics: ą, ć, ę, ł, ń, ó, ś, ź, ż)."""
         text = "Łódź"  # Contains Ł and ź
         result = process_latin(text, "pl", normalize_diacritics_flag=False)
@@ -393,7 +441,7 @@ class TestLatinProcessor:
         assert "Ł" in result.text and "ź" in result.text  # Diacritics preserved
         assert "preserve_diacritics" in result.applied_rules
     
-    def test_latin_processing_polish_diacritics(self, language_info_pl):
+    def test_latin_processing_polish_diacritics(self):
         """Test Polish multiple diacritics preservation."""
         text = "Zażółć gęślą jaźń"  # Contains many Polish diacritics
         result = process_latin(text, "pl", normalize_diacritics_flag=False)
@@ -418,105 +466,150 @@ class TestLatinProcessor:
 class TestScriptHandler:
     """Test main script handler."""
     
-    def test_handler_initialization(self):
+    def test_handler_initialization(self, fresh_handler):
         """Test handler initialization."""
-        handler = ScriptHandler()
-        assert handler is not None
+        assert fresh_handler is not None
     
-    def test_process_arabic_text(self, language_info_fa):
+    @pytest.mark.parametrize("language_info", ["fa"], indirect=True)
+    def test_process_arabic_text(self, handler, language_info):
         """Test processing Arabic text."""
-        handler = ScriptHandler()
-        text = "می‌خواهم"
-        result = handler.process_by_script(text, language_info_fa)
+        text = SAMPLES["fa"]
+        result = handler.process_by_script(text, language_info)
         
         assert isinstance(result, ProcessedText)
         assert result.script_code == "Arab"
-        assert result.confidence == language_info_fa.confidence
+        assert result.confidence == language_info.confidence
     
-    def test_process_urdu_text(self, language_info_ur):
+    @pytest.mark.parametrize("language_info", ["ur"], indirect=True)
+    def test_process_urdu_text(self, handler, language_info):
         """Test processing Urdu text."""
-        handler = ScriptHandler()
         text = "آپ کیسے ہیں"
-        result = handler.process_by_script(text, language_info_ur)
+        result = handler.process_by_script(text, language_info)
         
         assert isinstance(result, ProcessedText)
         assert result.script_code == "Arab"
         assert result.language_code == "ur"
-        assert result.confidence == language_info_ur.confidence
+        assert result.confidence == language_info.confidence
         assert "preserve_zwnj" in result.applied_rules
     
     @pytest.mark.requires_jieba
-    def test_process_chinese_text(self, language_info_zh):
+    @pytest.mark.parametrize("language_info", ["zh"], indirect=True)
+    def test_process_chinese_text(self, handler, language_info):
         """Test processing Chinese text."""
-        handler = ScriptHandler()
-        text = "你好世界"
-        result = handler.process_by_script(text, language_info_zh)
+        text = SAMPLES["zh"]
+        result = handler.process_by_script(text, language_info)
         
         assert isinstance(result, ProcessedText)
         assert result.script_code == "Hans"
     
-    def test_process_cyrillic_text(self, language_info_ru):
+    @pytest.mark.parametrize("language_info", ["ru"], indirect=True)
+    def test_process_cyrillic_text(self, handler, language_info):
         """Test processing Cyrillic text."""
-        handler = ScriptHandler()
         text = "Привет"
-        result = handler.process_by_script(text, language_info_ru)
+        result = handler.process_by_script(text, language_info)
         
         assert isinstance(result, ProcessedText)
         assert result.script_code == "Cyrl"
     
-    def test_process_latin_text(self, language_info_en):
+    @pytest.mark.parametrize("language_info", ["en"], indirect=True)
+    def test_process_latin_text(self, handler, language_info):
         """Test processing Latin text."""
-        handler = ScriptHandler()
-        text = "Hello World"
-        result = handler.process_by_script(text, language_info_en)
+        text = SAMPLES["en"]
+        result = handler.process_by_script(text, language_info)
         
         assert isinstance(result, ProcessedText)
         assert result.script_code == "Latn"
     
-    def test_process_german_text(self, language_info_de):
+    def test_process_every_language(self, handler, language_info):
+        """Test every table language keeps its script and confidence."""
+        result = handler.process_by_script("Sample 123", language_info)
+        
+        assert result.script_code == language_info.script_code
+        assert result.language_code == language_info.language_code
+        assert result.confidence == language_info.confidence
+    
+    @pytest.mark.parametrize("language_info", ["en"], indirect=True)
+    def test_process_ascii_latin_fastpath(self, handler, language_info):
+        """Test pure-ASCII Latin text skips the Latin rules unchanged."""
+        text = "Hello, World 42!"
+        result = handler.process_by_script(text, language_info, normalize_diacritics=True)
+        
+        assert result.text == text
+        assert result.applied_rules == ["ascii_fastpath"]
+        assert result.confidence == language_info.confidence
+        assert result.text == process_latin(text, "en", normalize_diacritics_flag=True).text
+    
+    @pytest.mark.parametrize("language_info", ["fa"], indirect=True)
+    def test_process_by_script_memoized(self, handler, language_info):
+        """Test repeated texts reuse the cached result without sharing it."""
+        from text_processing import script_handler
+        
+        text = "مَرْحَبًا می‌خواهم"
+        first = handler.process_by_script(text, language_info)
+        first.applied_rules.append("mutated")
+        hits = script_handler._route_cached.cache_info().hits
+        
+        second = handler.process_by_script(text, LanguageInfo("fa", "Arab", 0.5))
+        assert script_handler._route_cached.cache_info().hits == hits + 1
+        assert "mutated" not in second.applied_rules
+        assert second.text == first.text
+        assert second.confidence == 0.5
+        
+        # Options are part of the key
+        kept = handler.process_by_script(text, language_info, preserve_diacritics=True)
+        assert "preserve_diacritics" in kept.applied_rules
+    
+    def test_process_by_script_ignores_unknown_options(self, handler):
+        """Test options no processor reads are ignored, even unhashable ones."""
+        language_info = LanguageInfo("fr", "Latn", 0.9)
+        
+        result = handler.process_by_script("café", language_info, preserve_for_languages=['fr'])
+        
+        assert result == handler.process_by_script("café", language_info)
+    
+    @pytest.mark.parametrize("language_info", ["de"], indirect=True)
+    def test_process_german_text(self, handler, language_info):
         """Test processing German text with diacritics preservation."""
-        handler = ScriptHandler()
         text = "Müller"
-        result = handler.process_by_script(text, language_info_de)
+        result = handler.process_by_script(text, language_info)
         
         assert isinstance(result, ProcessedText)
         assert result.script_code == "Latn"
         assert result.language_code == "de"
         assert "ü" in result.text  # Diacritic preserved
     
-    def test_process_spanish_text(self, language_info_es):
+    @pytest.mark.parametrize("language_info", ["es"], indirect=True)
+    def test_process_spanish_text(self, handler, language_info):
         """Test processing Spanish text with diacritics preservation."""
-        handler = ScriptHandler()
         text = "España"
-        result = handler.process_by_script(text, language_info_es)
+        result = handler.process_by_script(text, language_info)
         
         assert isinstance(result, ProcessedText)
         assert result.script_code == "Latn"
         assert result.language_code == "es"
         assert "ñ" in result.text  # Diacritic preserved
     
-    def test_process_polish_text(self, language_info_pl):
+    @pytest.mark.parametrize("language_info", ["pl"], indirect=True)
+    def test_process_polish_text(self, handler, language_info):
         """Test processing Polish text with diacritics preservation."""
-        handler = ScriptHandler()
         text = "Łódź"
-        result = handler.process_by_script(text, language_info_pl)
+        result = handler.process_by_script(text, language_info)
         
         assert isinstance(result, ProcessedText)
         assert result.script_code == "Latn"
         assert result.language_code == "pl"
         assert "Ł" in result.text and "ź" in result.text  # Diacritics preserved
     
-    def test_process_empty_string(self, language_info_en):
+    @pytest.mark.parametrize("language_info", ["en"], indirect=True)
+    def test_process_empty_string(self, handler, language_info):
         """Test processing empty string."""
-        handler = ScriptHandler()
-        result = handler.process_by_script("", language_info_en)
+        result = handler.process_by_script("", language_info)
         
         assert result.text == ""
         assert result.original == ""
     
-    def test_process_unknown_script(self):
+    def test_process_unknown_script(self, handler):
         """Test processing unknown script."""
-        handler = ScriptHandler()
         lang_info = LanguageInfo(
             language_code="xx",
             script_code="Xxxx",
@@ -538,43 +631,79 @@ class TestMixedScript:
     
     def test_detect_script_boundaries(self):
         """Test script boundary detection."""
-        text = "Hello سلام"
+        text = SAMPLES["mixed_ar"]
         boundaries = detect_script_boundaries(text)
         
         assert len(boundaries) >= 1
         assert all(isinstance(b, tuple) and len(b) == 3 for b in boundaries)
     
-    def test_process_mixed_script(self, language_info_fa):
+    def test_detect_script_boundaries_cached(self):
+        """Test repeated texts hit the cache and long texts bypass it."""
+        from text_processing import script_handler
+        
+        text = "Hello 你好"
+        first = detect_script_boundaries(text)
+        first.append((0, 0, "Zyyy"))  # Callers get their own list
+        hits = script_handler._cached_script_boundaries.cache_info().hits
+        assert detect_script_boundaries(text) == [(0, 6, "Latn"), (6, 8, "Hans")]
+        assert script_handler._cached_script_boundaries.cache_info().hits == hits + 1
+        
+        long_text = "a" * (script_handler.BOUNDARY_CACHE_MAX_LENGTH + 1)
+        size = script_handler._cached_script_boundaries.cache_info().currsize
+        assert detect_script_boundaries(long_text) == [(0, len(long_text), "Latn")]
+        assert script_handler._cached_script_boundaries.cache_info().currsize == size
+    
+    def test_detect_script_boundaries_numpy_matches_regex(self):
+        """Test the NumPy lookup table segments like the regex scan."""
+        from text_processing import script_handler
+        
+        if not script_handler.NUMPY_AVAILABLE:
+            pytest.skip("numpy not available")
+        
+        text = " Hello, سلام می‌خواهم! 你好世界。Привет мир 123 ひらがな 한국어 ß_é" * 20
+        regex_boundaries = []
+        for match in script_handler._SCRIPT_RUNS.finditer(text):
+            if not regex_boundaries or regex_boundaries[-1][2] != match.lastgroup:
+                if regex_boundaries:
+                    regex_boundaries[-1][1] = match.start()
+                regex_boundaries.append([match.start(), len(text), match.lastgroup])
+        
+        assert script_handler._scan_script_boundaries_numpy(text) == [
+            tuple(b) for b in regex_boundaries
+        ]
+        assert script_handler._scan_script_boundaries_numpy(" ,. ") == []
+    
+    @pytest.mark.parametrize("language_info", ["fa"], indirect=True)
+    def test_process_mixed_script(self, handler, language_info):
         """Test processing mixed-script text."""
-        handler = ScriptHandler()
         text = "Hello سلام World"
-        result = handler.process_mixed_script(text, language_info_fa)
+        result = handler.process_mixed_script(text, language_info)
         
         assert isinstance(result, ProcessedText)
         assert len(result.applied_rules) > 0
     
-    def test_mixed_arabic_latin(self, language_info_fa):
+    @pytest.mark.parametrize("language_info", ["fa"], indirect=True)
+    def test_mixed_arabic_latin(self, handler, language_info):
         """Test Arabic-Latin mixed text."""
-        handler = ScriptHandler()
-        text = "Hello سلام"
-        result = handler.process_mixed_script(text, language_info_fa)
+        text = SAMPLES["mixed_ar"]
+        result = handler.process_mixed_script(text, language_info)
         
         assert result.original == text
         assert len(result.applied_rules) > 0
     
-    def test_mixed_cjk_latin(self, language_info_zh):
+    @pytest.mark.parametrize("language_info", ["zh"], indirect=True)
+    def test_mixed_cjk_latin(self, handler, language_info):
         """Test CJK-Latin mixed text."""
-        handler = ScriptHandler()
         text = "Hello 你好"
-        result = handler.process_mixed_script(text, language_info_zh)
+        result = handler.process_mixed_script(text, language_info)
         
         assert result.original == text
     
-    def test_bidirectional_text(self, language_info_fa):
+    @pytest.mark.parametrize("language_info", ["fa"], indirect=True)
+    def test_bidirectional_text(self, handler, language_info):
         """Test bidirectional text handling."""
-        handler = ScriptHandler()
         text = "Hello سلام World"
-        result = handler.process_mixed_script(text, language_info_fa)
+        result = handler.process_mixed_script(text, language_info)
         
         assert isinstance(result, ProcessedText)
 
@@ -586,14 +715,27 @@ class TestMixedScript:
 class TestConvenienceFunctions:
     """Test convenience functions."""
     
-    def test_process_by_script_function(self, language_info_en):
+    @pytest.mark.parametrize("language_info", ["en"], indirect=True)
+    def test_process_by_script_function(self, language_info):
         """Test process_by_script convenience function."""
-        result = process_by_script("Hello", language_info_en)
+        result = process_by_script("Hello", language_info)
         assert isinstance(result, ProcessedText)
     
-    def test_process_mixed_script_function(self, language_info_fa):
+    @pytest.mark.parametrize("language_info", ["en"], indirect=True)
+    def test_convenience_functions_share_handler(self, language_info):
+        """Test the module functions reuse one ScriptHandler."""
+        from text_processing import script_handler
+        
+        process_by_script("Hello", language_info)
+        shared = script_handler._default_handler
+        process_mixed_script("Hello", language_info)
+        assert shared is not None
+        assert script_handler._default_handler is shared
+    
+    @pytest.mark.parametrize("language_info", ["fa"], indirect=True)
+    def test_process_mixed_script_function(self, language_info):
         """Test process_mixed_script convenience function."""
-        result = process_mixed_script("Hello سلام", language_info_fa)
+        result = process_mixed_script(SAMPLES["mixed_ar"], language_info)
         assert isinstance(result, ProcessedText)
 
 
@@ -604,10 +746,9 @@ class TestConvenienceFunctions:
 class TestEdgeCases:
     """Test edge cases and error handling."""
     
-    def test_empty_string_all_scripts(self):
+    def test_empty_string_all_scripts(self, handler):
         """Test empty string for all script types."""
         scripts = ["Arab", "Latn", "Cyrl", "Hans", "Jpan", "Kore"]
-        handler = ScriptHandler()
         
         for script in scripts:
             lang_info = LanguageInfo(
@@ -619,40 +760,40 @@ class TestEdgeCases:
             assert result.text == ""
             assert result.original == ""
     
-    def test_whitespace_only(self, language_info_en):
+    @pytest.mark.parametrize("language_info", ["en"], indirect=True)
+    def test_whitespace_only(self, handler, language_info):
         """Test whitespace-only text."""
-        handler = ScriptHandler()
-        result = handler.process_by_script("   ", language_info_en)
+        result = handler.process_by_script("   ", language_info)
         assert isinstance(result, ProcessedText)
     
-    def test_numbers_and_punctuation(self, language_info_en):
+    @pytest.mark.parametrize("language_info", ["en"], indirect=True)
+    def test_numbers_and_punctuation(self, handler, language_info):
         """Test text with numbers and punctuation."""
-        handler = ScriptHandler()
         text = "Hello 123! World."
-        result = handler.process_by_script(text, language_info_en)
+        result = handler.process_by_script(text, language_info)
         assert isinstance(result, ProcessedText)
     
-    def test_unicode_surrogates(self, language_info_en):
+    @pytest.mark.parametrize("language_info", ["en"], indirect=True)
+    def test_unicode_surrogates(self, handler, language_info):
         """Test handling of Unicode surrogates."""
-        handler = ScriptHandler()
         # Try to create text with potential issues
         text = "Hello"
-        result = handler.process_by_script(text, language_info_en)
+        result = handler.process_by_script(text, language_info)
         assert isinstance(result, ProcessedText)
     
-    def test_very_long_text(self, language_info_en):
+    @pytest.mark.parametrize("language_info", ["en"], indirect=True)
+    def test_very_long_text(self, handler, language_info):
         """Test very long text."""
-        handler = ScriptHandler()
         text = "Hello " * 1000
-        result = handler.process_by_script(text, language_info_en)
+        result = handler.process_by_script(text, language_info)
         assert isinstance(result, ProcessedText)
         assert len(result.text) > 0
     
-    def test_special_characters(self, language_info_en):
+    @pytest.mark.parametrize("language_info", ["en"], indirect=True)
+    def test_special_characters(self, handler, language_info):
         """Test text with special characters."""
-        handler = ScriptHandler()
         text = "Hello @#$%^&*() World"
-        result = handler.process_by_script(text, language_info_en)
+        result = handler.process_by_script(text, language_info)
         assert isinstance(result, ProcessedText)
 
 
@@ -663,31 +804,31 @@ class TestEdgeCases:
 class TestIntegration:
     """Test integration scenarios."""
     
-    def test_full_pipeline_arabic(self, language_info_fa):
+    @pytest.mark.parametrize("language_info", ["fa"], indirect=True)
+    def test_full_pipeline_arabic(self, handler, language_info):
         """Test full processing pipeline for Arabic."""
-        handler = ScriptHandler()
-        text = "می‌خواهم"
-        result = handler.process_by_script(text, language_info_fa)
+        text = SAMPLES["fa"]
+        result = handler.process_by_script(text, language_info)
         
         assert result.text == text  # ZWNJ preserved
-        assert result.confidence == language_info_fa.confidence
+        assert result.confidence == language_info.confidence
         assert "preserve_zwnj" in result.applied_rules
     
     @pytest.mark.requires_jieba
-    def test_full_pipeline_chinese(self, language_info_zh):
+    @pytest.mark.parametrize("language_info", ["zh"], indirect=True)
+    def test_full_pipeline_chinese(self, handler, language_info):
         """Test full processing pipeline for Chinese."""
-        handler = ScriptHandler()
-        text = "你好世界"
-        result = handler.process_by_script(text, language_info_zh)
+        text = SAMPLES["zh"]
+        result = handler.process_by_script(text, language_info)
         
         assert result.script_code == "Hans"
         assert len(result.word_boundaries) > 0
     
-    def test_full_pipeline_cyrillic(self, language_info_ru):
+    @pytest.mark.parametrize("language_info", ["ru"], indirect=True)
+    def test_full_pipeline_cyrillic(self, handler, language_info):
         """Test full processing pipeline for Cyrillic."""
-        handler = ScriptHandler()
-        text = "Привет мир"
-        result = handler.process_by_script(text, language_info_ru)
+        text = SAMPLES["ru"]
+        result = handler.process_by_script(text, language_info)
         
         assert result.script_code == "Cyrl"
         assert result.language_code == "ru"
@@ -701,28 +842,28 @@ class TestPerformance:
     """Test performance requirements."""
     
     @pytest.mark.slow
-    def test_throughput_requirement(self, language_info_en):
+    @pytest.mark.parametrize("language_info", ["en"], indirect=True)
+    def test_throughput_requirement(self, handler, language_info):
         """Test 1000+ docs/sec throughput requirement."""
         import time
-        handler = ScriptHandler()
-        texts = ["Hello World"] * 1000
+        texts = [SAMPLES["en"]] * 1000
         
         start = time.time()
         for text in texts:
-            handler.process_by_script(text, language_info_en)
+            handler.process_by_script(text, language_info)
         elapsed = time.time() - start
         
         throughput = len(texts) / elapsed
         assert throughput >= 1000, f"Throughput {throughput:.0f} docs/sec < 1000 docs/sec"
     
-    def test_latency_requirement(self, language_info_en):
+    @pytest.mark.parametrize("language_info", ["en"], indirect=True)
+    def test_latency_requirement(self, handler, language_info):
         """Test <10ms latency requirement."""
         import time
-        handler = ScriptHandler()
-        text = "Hello World"
+        text = SAMPLES["en"]
         
         start = time.time()
-        handler.process_by_script(text, language_info_en)
+        handler.process_by_script(text, language_info)
         elapsed = (time.time() - start) * 1000  # Convert to ms
         
         assert elapsed < 10, f"Latency {elapsed:.2f}ms >= 10ms"
@@ -767,3 +908,14 @@ class TestProcessedText:
         assert result.applied_rules == []
         assert result.word_boundaries == []
         assert result.confidence == 0.0
+    
+    def test_language_info_fallback_immutable(self):
+        """Test the shared fallback LanguageInfo is frozen and hashable."""
+        import dataclasses
+        from shared.types import LanguageInfo
+        
+        info = LanguageInfo("en", "Latn", 0.99)
+        assert info.detected_languages == ()
+        assert hash(info) == hash(LanguageInfo("en", "Latn", 0.99))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.language_code = "fr"
@@ -50,6 +50,29 @@ ARABIC_DIACRITICS = {
     '\u0670',  # Superscript Alef
 }
 
+# str.translate table deleting all diacritics in one C-level pass
+_DIACRITICS_TABLE = dict.fromkeys(map(ord, ARABIC_DIACRITICS))
+
+
+def _build_shape_table() -> dict:
+    """
+    Map Arabic Presentation Forms-A/B letters to their base letters.
+    
+    Only forms whose compatibility decomposition is a single character
+    (<isolated>/<initial>/<medial>/<final> X) are mapped, so normalization
+    never changes the text length; ligatures such as lam-alef are kept.
+    """
+    table = {}
+    for codepoint in (*range(0xFB50, 0xFE00), *range(0xFE70, 0xFF00)):
+        tag, _, base = unicodedata.decomposition(chr(codepoint)).partition(' ')
+        if tag in ('<isolated>', '<initial>', '<medial>', '<final>') and ' ' not in base:
+            table[codepoint] = int(base, 16)
+    return table
+
+
+# str.translate table folding contextual letter forms in one C-level pass
+_SHAPE_TABLE = _build_shape_table()
+
 # Arabic script range
 ARABIC_RANGE = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]')
 
@@ -86,19 +109,13 @@ def remove_arabic_diacritics(text: str) -> str:
     Returns:
         Text with diacritics removed
     """
-    result = []
-    removed_count = 0
-    
-    for char in text:
-        if char in ARABIC_DIACRITICS:
-            removed_count += 1
-            continue
-        result.append(char)
+    stripped = text.translate(_DIACRITICS_TABLE)
+    removed_count = len(text) - len(stripped)
     
     if removed_count > 0:
         logger.debug(f"Removed {removed_count} Arabic diacritics")
     
-    return ''.join(result)
+    return stripped
 
 
 def normalize_arabic_shapes(text: str) -> str:
@@ -120,28 +137,10 @@ def normalize_arabic_shapes(text: str) -> str:
     # - Medial: in middle of word
     # - Final: at end of word
     
-    # Use Unicode normalization to convert to isolated forms
-    # NFC normalization helps with some cases, but we need more specific handling
-    
-    normalized = []
-    for char in text:
-        # Check if character is Arabic
-        if ARABIC_RANGE.match(char):
-            # Use Unicode name to identify contextual forms
-            try:
-                name = unicodedata.name(char, '')
-                # If it's a contextual form, try to normalize
-                # For now, we preserve the character as-is
-                # Full normalization would require Arabic shaping library
-                normalized.append(char)
-            except ValueError:
-                normalized.append(char)
-        else:
-            normalized.append(char)
-    
-    # For production, consider using python-arabic-reshaper or similar
-    # For now, we preserve original shapes
-    return ''.join(normalized)
+    # Text normally stores base letters and leaves shaping to the renderer;
+    # presentation-form code points (from PDFs, legacy encodings) are folded
+    # back so both spellings index the same. Ligatures are left as-is.
+    return text.translate(_SHAPE_TABLE)
 
 
 def process_arabic(
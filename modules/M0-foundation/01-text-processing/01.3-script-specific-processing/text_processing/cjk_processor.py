@@ -2,12 +2,16 @@
 CJK Script Processor - Task 01.3
 
 Handles Chinese, Japanese, and Korean text processing:
-- Chinese: jieba word segmentation
+- Chinese: jieba word segmentation (rjieba, the jieba-rs binding, when installed)
 - Japanese: Tokenization (MeCab optional)
 - Korean: Hangul syllable handling and word boundaries
 """
 
+import logging
+import os
 import re
+import threading
+from pathlib import Path
 from typing import List, Optional
 
 from shared.logger import setup_logger
@@ -21,30 +25,91 @@ else:
 
 logger = setup_logger(__name__)
 
-# Lazy load jieba (heavy dependency)
+# Lazy load jieba (heavy dependency); one shared Tokenizer per process
 _jieba = None
+_jieba_lock = threading.Lock()
 _mecab = None
 
+# jieba's large dictionary (dict.txt.big, ~8MB): more words in the trie,
+# better F1 and fewer out-of-vocabulary HMM/Viterbi passes. Not bundled by
+# default; drop it at this path or point JIEBA_DICTIONARY at a copy.
+BIG_DICTIONARY_PATH = Path(__file__).parent / "data" / "dict.txt.big"
+
+
+def _jieba_dictionary() -> Optional[Path]:
+    """Custom jieba dictionary to load, or None for jieba's built-in one."""
+    configured = os.environ.get("JIEBA_DICTIONARY")
+    if configured:
+        return Path(configured)
+    if BIG_DICTIONARY_PATH.exists():
+        return BIG_DICTIONARY_PATH
+    return None
+
 
 def _get_jieba():
-    """Lazy load jieba for Chinese segmentation."""
+    """
+    Load a jieba segmenter for Chinese and return it.
+    
+    Prefers rjieba (Rust jieba-rs), then jieba-fast, then jieba; the latter
+    two return their default Tokenizer. Either way the object provides
+    cut(text) and cut_for_search(text). The dictionary is loaded once per
+    process (guarded by a lock so concurrent first calls don't build it
+    twice) and shared by every caller.
+    
+    A custom dictionary (see _jieba_dictionary) is only supported by the
+    Python jieba packages, so rjieba is skipped when one is configured.
+    """
     global _jieba
     if _jieba is None:
-        try:
-            import jieba_fast as jieba
-            _jieba = jieba
-            logger.info("Loaded jieba-fast for Chinese segmentation")
-        except ImportError:
-            try:
-                import jieba
-                _jieba = jieba
-                logger.warning("Using jieba (slow) instead of jieba-fast")
-            except ImportError:
-                logger.error("jieba not available - Chinese segmentation disabled")
-                raise ImportError("jieba or jieba-fast required for Chinese processing")
+        with _jieba_lock:
+            if _jieba is None:
+                dictionary = _jieba_dictionary()
+                if dictionary is None:
+                    try:
+                        import rjieba
+                        # Force the lazily built Rust dictionary to load now
+                        rjieba.cut("中文")
+                        _jieba = rjieba
+                        logger.info("Loaded rjieba for Chinese segmentation")
+                        return _jieba
+                    except ImportError:
+                        pass
+                
+                try:
+                    import jieba_fast as jieba
+                    logger.info("Loaded jieba-fast for Chinese segmentation")
+                except ImportError:
+                    try:
+                        import jieba
+                        logger.warning("Using jieba (slow) instead of jieba-fast")
+                    except ImportError:
+                        logger.error("jieba not available - Chinese segmentation disabled")
+                        raise ImportError("jieba or jieba-fast required for Chinese processing")
+                
+                # jieba logs dictionary loading at DEBUG to stderr
+                jieba.setLogLevel(logging.INFO)
+                if dictionary is not None:
+                    jieba.set_dictionary(str(dictionary))
+                    logger.info("Using custom jieba dictionary", dictionary=str(dictionary))
+                jieba.initialize()
+                _jieba = jieba.dt
     return _jieba
 
 
+def preload_jieba() -> bool:
+    """
+    Load the jieba dictionary now instead of on the first Chinese text.
+    
+    Returns:
+        True if jieba is loaded, False if it is not installed
+    """
+    try:
+        _get_jieba()
+    except ImportError:
+        return False
+    return True
+
+
 def _get_mecab():
     """Lazy load MeCab for Japanese tokenization (optional)."""
     global _mecab
@@ -59,19 +124,25 @@ def _get_mecab():
     return _mecab
 
 
-def segment_chinese(text: str) -> List[str]:
+def segment_chinese(text: str, search_mode: bool = False) -> List[str]:
     """
     Segment Chinese text into words using jieba.
     
     Args:
         text: Chinese text
+        search_mode: Use cut_for_search, which also emits the shorter words
+                    inside long compounds ("农业发展银行" -> 农业, 发展,
+                    银行, 农业发展银行) for better index recall. Tokens
+                    overlap, so they don't map to word boundaries
+                    (default: False)
         
     Returns:
         List of segmented words
     """
-    jieba = _get_jieba()
-    words = jieba.cut(text, cut_all=False)
-    return list(words)
+    tokenizer = _get_jieba()
+    if search_mode:
+        return list(tokenizer.cut_for_search(text))
+    return list(tokenizer.cut(text))
 
 
 def segment_japanese(text: str) -> List[str]:
@@ -175,19 +246,23 @@ def get_word_boundaries(text: str, words: List[str]) -> List[int]:
     current_pos = 0
     
     for word in words:
-        # Find word in text starting from current position
-        pos = text.find(word, current_pos)
+        # Segmenters return contiguous words, so check the cursor before
+        # searching the rest of the text
+        if text.startswith(word, current_pos):
+            pos = current_pos
+        else:
+            pos = text.find(word, current_pos)
         if pos != -1:
-            boundaries.append(pos + len(word))
             current_pos = pos + len(word)
         else:
             # Word not found, advance by word length
             current_pos += len(word)
+        
+        # The cursor never moves back, so skipping repeats keeps the
+        # list sorted and unique
+        if current_pos != boundaries[-1]:
             boundaries.append(current_pos)
     
-    # Remove duplicates and sort
-    boundaries = sorted(set(boundaries))
-    
     return boundaries
 
 
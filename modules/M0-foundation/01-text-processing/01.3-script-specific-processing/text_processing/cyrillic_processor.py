@@ -23,6 +23,11 @@ logger = setup_logger(__name__)
 # Cyrillic ё (U+0451) and е (U+0435)
 CYRILLIC_YO = '\u0451'  # ё
 CYRILLIC_E = '\u0435'   # е
+CYRILLIC_YO_UPPER = '\u0401'  # Ё
+CYRILLIC_E_UPPER = '\u0415'   # Е
+
+# ё → е and Ё → Е in one C-level str.translate pass
+_YO_TABLE = str.maketrans({CYRILLIC_YO: CYRILLIC_E, CYRILLIC_YO_UPPER: CYRILLIC_E_UPPER})
 
 # Languages that should preserve ё
 PRESERVE_YO_LANGUAGES: Set[str] = {
@@ -50,7 +55,7 @@ def unify_cyrillic_variants(
     """
     Unify Cyrillic character variants.
     
-    Main operation: ё → е normalization (configurable).
+    Main operation: ё → е (and Ё → Е) normalization (configurable).
     Preserves language-specific characters for Ukrainian/Belarusian.
     
     Args:
@@ -64,24 +69,17 @@ def unify_cyrillic_variants(
     if not text:
         return text
     
-    result = []
-    normalized_count = 0
-    
     # Check if we should preserve ё for this language
     should_preserve_yo = language_code in PRESERVE_YO_LANGUAGES and not normalize_yo
+    if should_preserve_yo:
+        return text
     
-    for char in text:
-        # Normalize ё to е (unless preserving)
-        if char == CYRILLIC_YO and not should_preserve_yo:
-            result.append(CYRILLIC_E)
-            normalized_count += 1
-        else:
-            result.append(char)
-    
-    if normalized_count > 0:
-        logger.debug(f"Normalized {normalized_count} ё → е")
+    normalized_count = text.count(CYRILLIC_YO) + text.count(CYRILLIC_YO_UPPER)
+    if normalized_count == 0:
+        return text
     
-    return ''.join(result)
+    logger.debug(f"Normalized {normalized_count} ё → е")
+    return text.translate(_YO_TABLE)
 
 
 def process_cyrillic(
@@ -64,6 +64,23 @@ NON_SEMANTIC_LIGATURES = {
 }
 
 
+class _MarkTable(dict):
+    """
+    str.translate table deleting nonspacing marks (category Mn).
+    
+    Filled on demand: each code point's category is looked up once, after
+    which translate resolves it with a C-level dict hit.
+    """
+    
+    def __missing__(self, codepoint: int):
+        value = None if unicodedata.category(chr(codepoint)) == 'Mn' else codepoint
+        self[codepoint] = value
+        return value
+
+
+_STRIP_MARKS = _MarkTable()
+
+
 def normalize_diacritics(
     text: str,
     preserve_for_languages: List[str] = None
@@ -90,30 +107,19 @@ def normalize_diacritics(
         # Preserve diacritics for specified languages
         return text
     
-    # Normalize diacritics using Unicode NFD + remove combining marks
-    normalized = []
-    removed_count = 0
+    if text.isascii():
+        return text
     
-    for char in text:
-        # Decompose character (é → e + combining acute)
-        decomposed = unicodedata.normalize('NFD', char)
-        
-        # Keep base character, remove combining marks
-        base_chars = []
-        for c in decomposed:
-            category = unicodedata.category(c)
-            if category != 'Mn':  # Mn = Nonspacing Mark (diacritics)
-                base_chars.append(c)
-        
-        if len(base_chars) < len(decomposed):
-            removed_count += 1
-        
-        normalized.extend(base_chars)
+    # Decompose (é → e + combining acute), then drop nonspacing marks in a
+    # single str.translate pass
+    decomposed = unicodedata.normalize('NFD', text)
+    normalized = decomposed.translate(_STRIP_MARKS)
+    removed_count = len(decomposed) - len(normalized)
     
     if removed_count > 0:
         logger.debug(f"Normalized {removed_count} diacritics")
     
-    return ''.join(normalized)
+    return normalized
 
 
 def handle_ligatures(text: str, preserve_semantic: bool = True) -> str:
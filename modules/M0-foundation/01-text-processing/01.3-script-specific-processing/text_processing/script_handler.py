@@ -7,14 +7,20 @@ Handles mixed-script text and bidirectional text.
 """
 
 import re
-import sys
-from pathlib import Path
+from dataclasses import replace
+from functools import lru_cache
 from typing import List, Tuple, Optional, TYPE_CHECKING
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 from shared.logger import setup_logger
 
 from .arabic_processor import process_arabic
-from .cjk_processor import process_cjk
+from .cjk_processor import process_cjk, preload_jieba
 from .cyrillic_processor import process_cyrillic
 from .latin_processor import process_latin
 
@@ -27,62 +33,75 @@ else:
 
 logger = setup_logger(__name__)
 
-# Try to import LanguageInfo from Task 01.2
-try:
-    task_01_2_path = Path(__file__).parent.parent.parent.parent / "01.2-language-detection"
-    if task_01_2_path.exists():
-        sys.path.insert(0, str(task_01_2_path))
-        from text_processing import LanguageInfo
-    else:
-        # Fallback: define minimal LanguageInfo if Task 01.2 not available
-        from dataclasses import dataclass
-        from typing import List, Tuple
-        
-        @dataclass
-        class LanguageInfo:
-            language_code: str
-            script_code: str
-            confidence: float
-            is_mixed_content: bool = False
-            detected_languages: List[Tuple[str, float]] = None
-            
-            def __post_init__(self):
-                if self.detected_languages is None:
-                    self.detected_languages = []
-except ImportError:
-    # Fallback: define minimal LanguageInfo
-    from dataclasses import dataclass
-    from typing import List, Tuple
-    
-    @dataclass
-    class LanguageInfo:
-        language_code: str
-        script_code: str
-        confidence: float
-        is_mixed_content: bool = False
-        detected_languages: List[Tuple[str, float]] = None
-        
-        def __post_init__(self):
-            if self.detected_languages is None:
-                self.detected_languages = []
+# Minimal LanguageInfo for annotations and per-segment infos; Task 01.2's
+# LanguageInfo (same fields) is accepted wherever one is expected
+from shared.types import LanguageInfo
 
 
+# Code-point ranges (inclusive) of each script
+SCRIPT_RANGES = {
+    'Arab': ((0x0600, 0x06FF), (0x0750, 0x077F), (0x08A0, 0x08FF), (0xFB50, 0xFDFF), (0xFE70, 0xFEFF)),
+    'Latn': ((0x0041, 0x005A), (0x0061, 0x007A)),
+    'Cyrl': ((0x0400, 0x04FF),),
+    'Hans': ((0x4E00, 0x9FFF),),
+    'Hant': ((0x4E00, 0x9FFF),),
+    'Jpan': ((0x3040, 0x309F), (0x30A0, 0x30FF), (0x4E00, 0x9FFF)),  # Hiragana, Katakana, Kanji
+    'Kore': ((0xAC00, 0xD7AF), (0x1100, 0x11FF), (0x3130, 0x318F)),  # Hangul
+}
+
 # Script detection regex patterns
 SCRIPT_PATTERNS = {
-    'Arab': re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]'),
-    'Latn': re.compile(r'[a-zA-Z]'),
-    'Cyrl': re.compile(r'[\u0400-\u04FF]'),
-    'Hans': re.compile(r'[\u4E00-\u9FFF]'),
-    'Hant': re.compile(r'[\u4E00-\u9FFF]'),
-    'Jpan': re.compile(r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF]'),  # Hiragana, Katakana, Kanji
-    'Kore': re.compile(r'[\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F]'),  # Hangul
+    script_code: re.compile(
+        '[' + ''.join(f'\\U{first:08X}-\\U{last:08X}' for first, last in ranges) + ']'
+    )
+    for script_code, ranges in SCRIPT_RANGES.items()
 }
 
 
+def _compile_script_runs(script_patterns) -> 're.Pattern':
+    """
+    Combine the per-character script patterns into one run-matching regex.
+    
+    Each script becomes a named group matching a run of alphanumeric
+    characters in its class that no earlier script claims (so dict order
+    still decides overlaps, e.g. Han is Hans, not Jpan). Other alphanumeric
+    characters form "Zyyy" runs; whitespace and punctuation never match.
+    """
+    alternatives = []
+    earlier = ''
+    for script_code, pattern in script_patterns.items():
+        alternatives.append(
+            f'(?P<{script_code}>(?:(?=[^\\W_]){earlier}{pattern.pattern})+)'
+        )
+        earlier += f'(?!{pattern.pattern})'
+    alternatives.append(f'(?P<Zyyy>(?:{earlier}[^\\W_])+)')
+    return re.compile('|'.join(alternatives))
+
+
+# All scripts in one pattern, scanned in C instead of per character
+_SCRIPT_RUNS = _compile_script_runs(SCRIPT_PATTERNS)
+
+# Texts at least this long are classified with the NumPy lookup table
+NUMPY_MIN_LENGTH = 256
+
+# Script codes by lookup-table value; 0 is whitespace/punctuation
+_LUT_SCRIPTS = ('',) + tuple(SCRIPT_RANGES) + ('Zyyy',)
+
+# Texts up to this length have their processing results memoized
+PROCESS_CACHE_MAX_LENGTH = 4096
+
+# Texts up to this length have their boundaries memoized; longer ones are
+# rarely repeated and would only churn the cache
+BOUNDARY_CACHE_MAX_LENGTH = 4096
+
+
 def detect_script_boundaries(text: str) -> List[Tuple[int, int, str]]:
     """
     Detect script boundaries in mixed-script text.
     
+    A segment starts at the first letter/digit of its script and runs up
+    to the next segment; whitespace and punctuation stay in the current one.
+    
     Args:
         text: Input text
         
@@ -91,45 +110,81 @@ def detect_script_boundaries(text: str) -> List[Tuple[int, int, str]]:
     """
     if not text:
         return []
+    if len(text) > BOUNDARY_CACHE_MAX_LENGTH:
+        return _scan_script_boundaries(text)
+    return list(_cached_script_boundaries(text))
+
+
+@lru_cache(maxsize=2048)
+def _cached_script_boundaries(text: str) -> Tuple[Tuple[int, int, str], ...]:
+    """Memoized _scan_script_boundaries (a tuple, so callers can't mutate it)."""
+    return tuple(_scan_script_boundaries(text))
+
+
+@lru_cache(maxsize=None)
+def _script_lut() -> 'np.ndarray':
+    """
+    Build the code point -> _LUT_SCRIPTS index table (uint8, 1.1 MB).
+    
+    Letters/digits are marked Zyyy, then SCRIPT_RANGES are painted over
+    them by slice assignment, last script first so earlier ones win
+    overlaps - the same classification as _SCRIPT_RUNS, in milliseconds.
+    """
+    all_chars = np.arange(0x110000, dtype='<u4').tobytes().decode('utf-32-le', 'surrogatepass')
+    lut = np.zeros(0x110000, dtype=np.uint8)
+    for match in re.finditer(r'[^\W_]+', all_chars):
+        lut[match.start():match.end()] = len(_LUT_SCRIPTS) - 1
+    alnum = lut != 0
+    
+    for value in range(len(SCRIPT_RANGES), 0, -1):
+        for first, last in SCRIPT_RANGES[_LUT_SCRIPTS[value]]:
+            run = slice(first, last + 1)
+            lut[run] = np.where(alnum[run], value, 0)
+    return lut
+
+
+def _scan_script_boundaries_numpy(text: str) -> List[Tuple[int, int, str]]:
+    """Vectorized _scan_script_boundaries: one table lookup per code point."""
+    codes = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype='<u4')
+    scripts = _script_lut()[codes]
+    
+    # Whitespace/punctuation (0) stays in the current segment, so segments
+    # start where the script of the letters/digits changes
+    positions = np.flatnonzero(scripts)
+    if not positions.size:
+        return []
+    letter_scripts = scripts[positions]
+    firsts = np.concatenate(([0], np.flatnonzero(letter_scripts[1:] != letter_scripts[:-1]) + 1))
+    
+    starts = positions[firsts].tolist()
+    ends = starts[1:] + [len(text)]
+    return [
+        (start, end, _LUT_SCRIPTS[script])
+        for start, end, script in zip(starts, ends, letter_scripts[firsts].tolist())
+    ]
+
+
+def _scan_script_boundaries(text: str) -> List[Tuple[int, int, str]]:
+    """Scan text for script boundaries (see detect_script_boundaries)."""
+    if NUMPY_AVAILABLE and len(text) >= NUMPY_MIN_LENGTH:
+        return _scan_script_boundaries_numpy(text)
     
     boundaries = []
     current_script = None
     start_pos = 0
     
-    i = 0
-    while i < len(text):
-        char = text[i]
-        
-        # Skip whitespace and punctuation
-        if char.isspace() or not char.isalnum():
-            i += 1
-            continue
-        
-        # Detect script for this character
-        detected_script = None
-        for script_code, pattern in SCRIPT_PATTERNS.items():
-            if pattern.match(char):
-                detected_script = script_code
-                break
-        
-        # If no script detected, use "Zyyy" (Common)
-        if detected_script is None:
-            detected_script = "Zyyy"
+    for match in _SCRIPT_RUNS.finditer(text):
+        detected_script = match.lastgroup
         
         # If script changed, save previous segment
-        if current_script is not None and detected_script != current_script:
-            if i > start_pos:
-                boundaries.append((start_pos, i, current_script))
-            start_pos = i
-            current_script = detected_script
-        elif current_script is None:
+        if detected_script != current_script:
+            if current_script is not None:
+                boundaries.append((start_pos, match.start(), current_script))
+            start_pos = match.start()
             current_script = detected_script
-            start_pos = i
-        
-        i += 1
     
     # Add final segment
-    if current_script is not None and start_pos < len(text):
+    if current_script is not None:
         boundaries.append((start_pos, len(text), current_script))
     
     return boundaries
@@ -154,13 +209,107 @@ def handle_bidirectional_text(text: str) -> str:
     return text
 
 
+def _route(
+    text: str,
+    script_code: str,
+    language_code: str,
+    options: dict
+) -> ProcessedText:
+    """
+    Run the processor for script_code on non-empty text.
+    
+    Args:
+        text: Input text
+        script_code: ISO 15924 script code
+        language_code: ISO 639-1 language code
+        options: Processor-specific options (ScriptHandler kwargs)
+        
+    Returns:
+        ProcessedText (confidence left for the caller to set)
+    """
+    # Route to appropriate processor
+    if script_code == "Arab":
+        result = process_arabic(
+            text,
+            language_code,
+            preserve_diacritics=options.get('preserve_diacritics', False),
+            normalize_shapes=options.get('normalize_shapes', True)
+        )
+    elif script_code in ("Hans", "Hant", "Jpan", "Kore"):
+        result = process_cjk(text, language_code, script_code)
+    elif script_code == "Cyrl":
+        result = process_cyrillic(
+            text,
+            language_code,
+            normalize_yo=options.get('normalize_yo', True)
+        )
+    elif script_code == "Latn" and text.isascii():
+        # No ligatures or diacritics in ASCII: every Latin rule is a no-op
+        result = ProcessedText(
+            text=text,
+            original=text,
+            script_code="Latn",
+            language_code=language_code,
+            applied_rules=["ascii_fastpath"]
+        )
+    elif script_code == "Latn":
+        result = process_latin(
+            text,
+            language_code,
+            normalize_diacritics_flag=options.get('normalize_diacritics', False),
+            preserve_semantic_ligatures=options.get('preserve_semantic_ligatures', True)
+        )
+    else:
+        # Unknown script - return as-is
+        logger.warning(f"Unknown script code: {script_code}, returning text as-is")
+        result = ProcessedText(
+            text=text,
+            original=text,
+            script_code=script_code,
+            language_code=language_code,
+            applied_rules=["no_processing"]
+        )
+    
+    return result
+
+
+# The kwargs _route reads; only these go into the _route_cached key, so
+# other (possibly unhashable) options are ignored as before
+_ROUTE_OPTIONS = (
+    'normalize_diacritics',
+    'normalize_shapes',
+    'normalize_yo',
+    'preserve_diacritics',
+    'preserve_semantic_ligatures',
+)
+
+
+@lru_cache(maxsize=512)
+def _route_cached(
+    text: str,
+    script_code: str,
+    language_code: str,
+    options: Tuple[Tuple[str, object], ...]
+) -> ProcessedText:
+    """Memoized _route; options as (name, value) pairs in _ROUTE_OPTIONS order."""
+    return _route(text, script_code, language_code, dict(options))
+
+
 class ScriptHandler:
     """
     Main handler for script-specific text processing.
     """
     
-    def __init__(self):
-        """Initialize script handler."""
+    def __init__(self, preload_cjk: bool = True):
+        """
+        Initialize script handler.
+        
+        Args:
+            preload_cjk: Load the shared jieba dictionary now rather than
+                        on the first Chinese text (default: True)
+        """
+        if preload_cjk:
+            preload_jieba()
         logger.info("Initialized ScriptHandler")
     
     def process_by_script(
@@ -193,39 +342,16 @@ class ScriptHandler:
         script_code = language_info.script_code
         language_code = language_info.language_code
         
-        # Route to appropriate processor
-        if script_code == "Arab":
-            result = process_arabic(
-                text,
-                language_code,
-                preserve_diacritics=kwargs.get('preserve_diacritics', False),
-                normalize_shapes=kwargs.get('normalize_shapes', True)
-            )
-        elif script_code in ("Hans", "Hant", "Jpan", "Kore"):
-            result = process_cjk(text, language_code, script_code)
-        elif script_code == "Cyrl":
-            result = process_cyrillic(
-                text,
-                language_code,
-                normalize_yo=kwargs.get('normalize_yo', True)
-            )
-        elif script_code == "Latn":
-            result = process_latin(
-                text,
-                language_code,
-                normalize_diacritics_flag=kwargs.get('normalize_diacritics', False),
-                preserve_semantic_ligatures=kwargs.get('preserve_semantic_ligatures', True)
-            )
+        if len(text) > PROCESS_CACHE_MAX_LENGTH:
+            result = _route(text, script_code, language_code, kwargs)
         else:
-            # Unknown script - return as-is
-            logger.warning(f"Unknown script code: {script_code}, returning text as-is")
-            result = ProcessedText(
-                text=text,
-                original=text,
-                script_code=script_code,
-                language_code=language_code,
-                applied_rules=["no_processing"],
-                confidence=language_info.confidence
+            options = tuple((name, kwargs[name]) for name in _ROUTE_OPTIONS if name in kwargs)
+            # Fresh copy of the memoized result: callers may mutate it
+            cached = _route_cached(text, script_code, language_code, options)
+            result = replace(
+                cached,
+                applied_rules=list(cached.applied_rules),
+                word_boundaries=list(cached.word_boundaries)
             )
         
         # Set confidence from language_info
@@ -317,6 +443,19 @@ class ScriptHandler:
         )
 
 
+# Shared handler for the convenience functions (created on first use; jieba
+# loads on the first Chinese text so other scripts never pay for it)
+_default_handler = None
+
+
+def _get_default_handler() -> ScriptHandler:
+    """Return the process-wide ScriptHandler used by the module functions."""
+    global _default_handler
+    if _default_handler is None:
+        _default_handler = ScriptHandler(preload_cjk=False)
+    return _default_handler
+
+
 # Convenience functions
 def process_by_script(
     text: str,
@@ -334,8 +473,7 @@ def process_by_script(
     Returns:
         ProcessedText with processed text and metadata
     """
-    handler = ScriptHandler()
-    return handler.process_by_script(text, language_info, **kwargs)
+    return _get_default_handler().process_by_script(text, language_info, **kwargs)
 
 
 def process_mixed_script(
@@ -354,5 +492,4 @@ def process_mixed_script(
     Returns:
         ProcessedText with processed text and metadata
     """
-    handler = ScriptHandler()
-    return handler.process_mixed_script(text, language_info, **kwargs)
+    return _get_default_handler().process_mixed_script(text, language_info, **kwargs)